@@ -6,7 +6,7 @@ from pydantic import BaseModel, ConfigDict, Field
 class ModelIdentity(BaseModel):
     """Model identity response from LLM."""
 
-    model_config = ConfigDict(strict=True)
+    model_config = ConfigDict(strict=True, frozen=True, defer_build=True)
 
     model_provider: str = Field(
         ...,
@@ -23,7 +23,7 @@ class ModelIdentity(BaseModel):
 class ContinentInfo(BaseModel):
     """Continent information response from LLM."""
 
-    model_config = ConfigDict(strict=True)
+    model_config = ConfigDict(strict=True, frozen=True, defer_build=True)
 
     description: str = Field(
         ...,
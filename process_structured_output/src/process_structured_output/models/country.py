@@ -2,11 +2,14 @@
 
 from pydantic import BaseModel, ConfigDict, Field
 
+# Maximum number of cities returned per country
+MAX_CITIES = 5
+
 
 class CountryInfo(BaseModel):
     """Country information response from LLM."""
 
-    model_config = ConfigDict(strict=True)
+    model_config = ConfigDict(strict=True, frozen=True, defer_build=True)
 
     description: str = Field(
         ...,
@@ -126,7 +129,7 @@ class CountryInfo(BaseModel):
 class CityInfo(BaseModel):
     """City information response from LLM."""
 
-    model_config = ConfigDict(strict=True)
+    model_config = ConfigDict(strict=True, frozen=True, defer_build=True)
 
     name: str = Field(
         ...,
@@ -196,8 +199,10 @@ class CityInfo(BaseModel):
 class CitiesResponse(BaseModel):
     """Response containing list of cities from LLM."""
 
+    model_config = ConfigDict(defer_build=True)
+
     cities: list[CityInfo] = Field(
         ...,
         description="List of cities",
-        max_length=5,
+        max_length=MAX_CITIES,
     )
@@ -30,6 +30,12 @@ CITY_FIELDS: list[tuple[str, str, str | None, bool]] = [
     ("airport_code", "string", "3-letter IATA code", True),
 ]
 
+# Field list for the user prompt, built once since CITY_FIELDS is fixed
+_CITY_FIELDS_TEXT = "\n".join(
+    f"- {name}: {type_}" + (f" ({desc})" if desc else "")
+    for name, type_, desc, _ in CITY_FIELDS
+)
+
 # Maximum character length for description and interesting_fact fields
 MAX_STRING_LENGTH = 250
 
@@ -43,14 +49,10 @@ def get_cities_user_prompt(country_name: str) -> str:
     Returns:
         Formatted user prompt string
     """
-    fields_text = "\n".join(
-        f"- {name}: {type_}" + (f" ({desc})" if desc else "")
-        for name, type_, desc, _ in CITY_FIELDS
-    )
     return (
         f"List up to 5 most populous cities in {country_name}. "
         f"Return a JSON object with a 'cities' array. "
-        f"Each city should have these fields:\n{fields_text}"
+        f"Each city should have these fields:\n{_CITY_FIELDS_TEXT}"
     )
 
 
@@ -40,6 +40,12 @@ COUNTRY_FIELDS: list[tuple[str, str, str | None]] = [
     ("gdp_per_capita", "number", "GDP per capita in $"),
 ]
 
+# Field list for the user prompt, built once since COUNTRY_FIELDS is fixed
+_COUNTRY_FIELDS_TEXT = "\n".join(
+    f"- {name}: {type_}" + (f" ({desc})" if desc else "")
+    for name, type_, desc in COUNTRY_FIELDS
+)
+
 
 def get_country_user_prompt(country_name: str) -> str:
     """Generate the user prompt for country information.
@@ -50,13 +56,9 @@ def get_country_user_prompt(country_name: str) -> str:
     Returns:
         Formatted user prompt string
     """
-    fields_text = "\n".join(
-        f"- {name}: {type_}" + (f" ({desc})" if desc else "")
-        for name, type_, desc in COUNTRY_FIELDS
-    )
     return (
         f"Provide information about the country {country_name} "
-        f"as a JSON object with these exact fields:\n{fields_text}"
+        f"as a JSON object with these exact fields:\n{_COUNTRY_FIELDS_TEXT}"
     )
 
 
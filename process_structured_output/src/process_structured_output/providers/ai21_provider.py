@@ -20,6 +20,7 @@ from process_structured_output.prompts import (
     truncate_city_strings,
     truncate_country_strings,
 )
+from process_structured_output.providers.retry import backoff_delay
 
 
 def _sanitize_json(content: str) -> str:
@@ -201,7 +202,7 @@ class AI21Provider:
                 last_error = e
                 if attempt < MAX_RETRIES - 1:
                     print(f"    [Retry {attempt + 1}/{MAX_RETRIES}] {e}")
-                    time.sleep(RETRY_DELAY)
+                    time.sleep(backoff_delay(attempt, RETRY_DELAY))
         raise ValueError(f"Failed after {MAX_RETRIES} attempts: {last_error}")
 
     def get_cities_info(self, country_name: str) -> list[CityInfo]:
@@ -270,5 +271,5 @@ class AI21Provider:
                 last_error = e
                 if attempt < MAX_RETRIES - 1:
                     print(f"    [Retry {attempt + 1}/{MAX_RETRIES}] {e}")
-                    time.sleep(RETRY_DELAY)
+                    time.sleep(backoff_delay(attempt, RETRY_DELAY))
         raise ValueError(f"Failed after {MAX_RETRIES} attempts: {last_error}")
@@ -16,6 +16,7 @@ from process_structured_output.prompts import (
     truncate_city_strings,
     truncate_country_strings,
 )
+from process_structured_output.providers.retry import backoff_delay
 
 # Maximum retries for transient LLM failures
 MAX_RETRIES = 3
@@ -112,7 +113,7 @@ class AnthropicProvider:
                 last_error = e
                 if attempt < MAX_RETRIES - 1:
                     print(f"    [Retry {attempt + 1}/{MAX_RETRIES}] {e}")
-                    time.sleep(RETRY_DELAY)
+                    time.sleep(backoff_delay(attempt, RETRY_DELAY))
         raise ValueError(f"Failed after {MAX_RETRIES} attempts: {last_error}")
 
     def get_cities_info(self, country_name: str) -> list[CityInfo]:
@@ -168,5 +169,5 @@ class AnthropicProvider:
                 last_error = e
                 if attempt < MAX_RETRIES - 1:
                     print(f"    [Retry {attempt + 1}/{MAX_RETRIES}] {e}")
-                    time.sleep(RETRY_DELAY)
+                    time.sleep(backoff_delay(attempt, RETRY_DELAY))
         raise ValueError(f"Failed after {MAX_RETRIES} attempts: {last_error}")
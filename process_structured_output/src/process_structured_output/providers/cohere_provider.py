@@ -18,6 +18,7 @@ from process_structured_output.prompts import (
     truncate_city_strings,
     truncate_country_strings,
 )
+from process_structured_output.providers.retry import backoff_delay
 
 
 def _sanitize_json(content: str) -> str:
@@ -185,7 +186,7 @@ class CohereProvider:
                 last_error = e
                 if attempt < MAX_RETRIES - 1:
                     print(f"    [Retry {attempt + 1}/{MAX_RETRIES}] {e}")
-                    time.sleep(RETRY_DELAY)
+                    time.sleep(backoff_delay(attempt, RETRY_DELAY))
             except Exception as e:
                 # Handle rate limits (429) and other API errors
                 last_error = e
@@ -195,7 +196,7 @@ class CohereProvider:
                         time.sleep(RATE_LIMIT_DELAY)
                 elif attempt < MAX_RETRIES - 1:
                     print(f"    [Retry {attempt + 1}/{MAX_RETRIES}] {e}")
-                    time.sleep(RETRY_DELAY)
+                    time.sleep(backoff_delay(attempt, RETRY_DELAY))
         raise ValueError(f"Failed after {MAX_RETRIES} attempts: {last_error}")
 
     def get_cities_info(self, country_name: str) -> list[CityInfo]:
@@ -264,7 +265,7 @@ class CohereProvider:
                 last_error = e
                 if attempt < MAX_RETRIES - 1:
                     print(f"    [Retry {attempt + 1}/{MAX_RETRIES}] {e}")
-                    time.sleep(RETRY_DELAY)
+                    time.sleep(backoff_delay(attempt, RETRY_DELAY))
             except Exception as e:
                 # Handle rate limits (429) and other API errors
                 last_error = e
@@ -274,5 +275,5 @@ class CohereProvider:
                         time.sleep(RATE_LIMIT_DELAY)
                 elif attempt < MAX_RETRIES - 1:
                     print(f"    [Retry {attempt + 1}/{MAX_RETRIES}] {e}")
-                    time.sleep(RETRY_DELAY)
+                    time.sleep(backoff_delay(attempt, RETRY_DELAY))
         raise ValueError(f"Failed after {MAX_RETRIES} attempts: {last_error}")
@@ -22,6 +22,7 @@ from process_structured_output.providers.cohere_provider import (
     _sanitize_json,
     _try_extract_json,
 )
+from process_structured_output.providers.retry import backoff_delay
 
 MAX_RETRIES = 3
 RETRY_DELAY = 1.0  # seconds
@@ -112,7 +113,7 @@ class DeepSeekProvider:
                 last_error = e
                 if attempt < MAX_RETRIES - 1:
                     print(f"    [Retry {attempt + 1}/{MAX_RETRIES}] {e}")
-                    time.sleep(RETRY_DELAY)
+                    time.sleep(backoff_delay(attempt, RETRY_DELAY))
             except Exception as e:
                 # Handle rate limits (429) and other API errors
                 last_error = e
@@ -122,7 +123,7 @@ class DeepSeekProvider:
                         time.sleep(RATE_LIMIT_DELAY)
                 elif attempt < MAX_RETRIES - 1:
                     print(f"    [Retry {attempt + 1}/{MAX_RETRIES}] {e}")
-                    time.sleep(RETRY_DELAY)
+                    time.sleep(backoff_delay(attempt, RETRY_DELAY))
         raise ValueError(f"Failed after {MAX_RETRIES} attempts: {last_error}")
 
     def get_cities_info(self, country_name: str) -> list[CityInfo]:
@@ -179,7 +180,7 @@ class DeepSeekProvider:
                 last_error = e
                 if attempt < MAX_RETRIES - 1:
                     print(f"    [Retry {attempt + 1}/{MAX_RETRIES}] {e}")
-                    time.sleep(RETRY_DELAY)
+                    time.sleep(backoff_delay(attempt, RETRY_DELAY))
             except Exception as e:
                 # Handle rate limits (429) and other API errors
                 last_error = e
@@ -189,5 +190,5 @@ class DeepSeekProvider:
                         time.sleep(RATE_LIMIT_DELAY)
                 elif attempt < MAX_RETRIES - 1:
                     print(f"    [Retry {attempt + 1}/{MAX_RETRIES}] {e}")
-                    time.sleep(RETRY_DELAY)
+                    time.sleep(backoff_delay(attempt, RETRY_DELAY))
         raise ValueError(f"Failed after {MAX_RETRIES} attempts: {last_error}")
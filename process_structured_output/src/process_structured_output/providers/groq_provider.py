@@ -25,6 +25,7 @@ from process_structured_output.prompts import (
     truncate_city_strings,
     truncate_country_strings,
 )
+from process_structured_output.providers.retry import backoff_delay
 
 # Retry configuration
 MAX_RETRIES = 3
@@ -159,7 +160,7 @@ class GroqProvider:
             except Exception as e:
                 last_error = e
                 if attempt < max_retries - 1:
-                    time.sleep(RETRY_DELAY)
+                    time.sleep(backoff_delay(attempt, RETRY_DELAY))
         raise ValueError(
             f"Failed after {max_retries} retries: {last_error}"
         ) from last_error
@@ -200,7 +201,7 @@ class GroqProvider:
             except Exception as e:
                 last_error = e
                 if attempt < max_retries - 1:
-                    time.sleep(RETRY_DELAY)
+                    time.sleep(backoff_delay(attempt, RETRY_DELAY))
         raise ValueError(
             f"Failed after {max_retries} retries: {last_error}"
         ) from last_error
@@ -6,14 +6,19 @@ Uses Mistral's Python SDK with JSON mode for structured output generation.
 import json
 import os
 import time
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from functools import lru_cache
+from pathlib import Path
+from types import TracebackType
+from typing import Annotated, Self
 
 from dotenv import load_dotenv
 from mistralai import Mistral
-from pydantic import ValidationError
+from pydantic import Field, TypeAdapter, ValidationError
 
 from process_structured_output.models.continent import ContinentInfo, ModelIdentity
 from process_structured_output.models.country import (
-    CitiesResponse,
+    MAX_CITIES,
     CityInfo,
     CountryInfo,
 )
@@ -25,12 +30,34 @@ from process_structured_output.prompts import (
     truncate_city_strings,
     truncate_country_strings,
 )
+from process_structured_output.providers.persistent_cache import PersistentCache
+from process_structured_output.providers.retry import backoff_delay
+from process_structured_output.providers.semantic_cache import SemanticCache
+
+# Embedding model used for the semantic cache
+EMBEDDING_MODEL = "mistral-embed"
 
 # Retry configuration
 MAX_RETRIES = 3
 RETRY_DELAY = 1.0
 
 
+@lru_cache(maxsize=1)
+def _city_list_adapter() -> TypeAdapter[list[CityInfo]]:
+    """Return the adapter that validates a whole city list in one call.
+
+    It applies the same length limit as CitiesResponse.cities. The adapter is
+    built on first use so importing the module does not build the CityInfo
+    schema.
+    """
+    return TypeAdapter(
+        Annotated[
+            list[CityInfo],
+            Field(max_length=MAX_CITIES),
+        ]
+    )
+
+
 def _sanitize_city_data(city: dict) -> dict:
     """Sanitize city data from LLM responses.
 
@@ -50,6 +77,59 @@ def _sanitize_city_data(city: dict) -> dict:
     return city
 
 
+def _iter_json_array_items(chunks: Iterable[str], key: str) -> Iterator[dict]:
+    """Yield objects from a JSON array as soon as each one is complete.
+
+    Consumes text chunks of a JSON object such as ``{"cities": [{...}, ...]}``
+    and yields each element of the array under ``key`` once its closing
+    brace has arrived, without waiting for the rest of the document.
+
+    Args:
+        chunks: Text fragments of the JSON document, in order
+        key: Name of the array field to read items from
+
+    Yields:
+        Decoded array elements
+
+    Raises:
+        json.JSONDecodeError: If the stream ends before the array is closed
+    """
+    decoder = json.JSONDecoder()
+    marker = f'"{key}"'
+    buffer = ""
+    in_array = False
+    chunk_iter = iter(chunks)
+
+    while True:
+        if not in_array:
+            start = buffer.find(marker)
+            bracket = buffer.find("[", start + len(marker)) if start >= 0 else -1
+            if bracket >= 0:
+                buffer = buffer[bracket + 1 :]
+                in_array = True
+
+        if in_array:
+            buffer = buffer.lstrip(" \t\r\n,")
+            if buffer.startswith("]"):
+                return
+            if buffer:
+                try:
+                    item, end = decoder.raw_decode(buffer)
+                except json.JSONDecodeError:
+                    pass  # Item still incomplete, read more
+                else:
+                    buffer = buffer[end:]
+                    yield item
+                    continue
+
+        chunk = next(chunk_iter, None)
+        if chunk is None:
+            raise json.JSONDecodeError(
+                f"Stream ended before '{key}' array was closed", buffer, 0
+            )
+        buffer += chunk
+
+
 class MistralProvider:
     """Mistral LLM provider using Mistral's Python SDK."""
 
@@ -57,6 +137,10 @@ class MistralProvider:
         self,
         api_key: str | None = None,
         model: str = "mistral-large-latest",
+        use_semantic_cache: bool = False,
+        embedding_fn: Callable[[str], Sequence[float]] | None = None,
+        use_persistent_cache: bool = False,
+        cache_path: Path | str | None = None,
     ) -> None:
         """Initialize the Mistral provider.
 
@@ -64,6 +148,14 @@ class MistralProvider:
             api_key: Mistral API key. If not provided, reads from
                 MISTRAL_API_KEY env var.
             model: Model name to use.
+            use_semantic_cache: If True, reuse country info for queries whose
+                embeddings are near-duplicates (e.g., "Algeria"/"algeria").
+            embedding_fn: Embedding function for the semantic cache.
+                Defaults to Mistral's embedding API.
+            use_persistent_cache: If True, store country info on disk so it
+                is reused across processes and runs.
+            cache_path: Database file for the persistent cache. Defaults to
+                ~/.cache/process_structured_output/responses.sqlite3.
         """
         load_dotenv()
 
@@ -76,6 +168,36 @@ class MistralProvider:
 
         self.model = model
         self.client = Mistral(api_key=self.api_key)
+        self.country_cache: SemanticCache[CountryInfo] | None = None
+        if use_semantic_cache:
+            self.country_cache = SemanticCache(embedding_fn or self._embed)
+        self.persistent_cache: PersistentCache | None = None
+        if use_persistent_cache:
+            self.persistent_cache = PersistentCache(cache_path)
+
+    def __enter__(self) -> Self:
+        """Return the provider for use in a with block."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Release the provider's resources when the with block exits."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the persistent cache's database connection, if one is open."""
+        if self.persistent_cache is not None:
+            self.persistent_cache.close()
+            self.persistent_cache = None
+
+    def _embed(self, text: str) -> list[float]:
+        """Return the Mistral embedding vector for a text."""
+        response = self.client.embeddings.create(model=EMBEDDING_MODEL, inputs=[text])
+        return list(response.data[0].embedding or [])
 
     def get_model_identity(self) -> ModelIdentity:
         """Return hardcoded model identity for Mistral.
@@ -119,13 +241,35 @@ class MistralProvider:
 
         content = str(response.choices[0].message.content) or "{}"
         try:
-            data = json.loads(content)
-            return ContinentInfo(**data)
-        except (json.JSONDecodeError, ValidationError) as e:
+            # Parse and validate in one pydantic-core pass
+            return ContinentInfo.model_validate_json(content)
+        except ValidationError as e:
             raise ValueError(f"Failed to parse continent info: {e}") from e
 
     def get_country_info(self, country_name: str) -> CountryInfo:
         """Get structured country information from Mistral."""
+        if self.country_cache is not None:
+            cached = self.country_cache.get(country_name)
+            if cached is not None:
+                return cached
+
+        if self.persistent_cache is None:
+            info = self._fetch_country_info(country_name)
+        else:
+            key = f"get_country_info:{self.model}:{country_name}"
+            stored = self.persistent_cache.get(key)
+            if stored is not None:
+                info = CountryInfo.model_validate_json(stored)
+            else:
+                info = self._fetch_country_info(country_name)
+                self.persistent_cache.set(key, info.model_dump_json())
+
+        if self.country_cache is not None:
+            self.country_cache.set(country_name, info)
+        return info
+
+    def _fetch_country_info(self, country_name: str) -> CountryInfo:
+        """Query Mistral for country information."""
         response = self.client.chat.complete(
             model=self.model,
             messages=[  # type: ignore[arg-type]
@@ -136,13 +280,16 @@ class MistralProvider:
         )
 
         content = str(response.choices[0].message.content) or "{}"
+        # Fail fast on the common empty reply so retries skip JSON parsing
+        if content.strip() in ("", "{}"):
+            raise ValueError("Empty JSON response from Mistral")
         try:
             data = json.loads(content)
             if not data:
                 raise ValueError("Empty JSON response from Mistral")
             # Truncate strings to enforce character limits
             data = truncate_country_strings(data)
-            return CountryInfo(**data)
+            return CountryInfo.model_validate(data)
         except json.JSONDecodeError as e:
             raise ValueError(f"Failed to parse country info: {e}") from e
         except ValidationError as e:
@@ -159,7 +306,7 @@ class MistralProvider:
             except Exception as e:
                 last_error = e
                 if attempt < max_retries - 1:
-                    time.sleep(RETRY_DELAY)
+                    time.sleep(backoff_delay(attempt, RETRY_DELAY))
         raise ValueError(
             f"Failed after {max_retries} retries: {last_error}"
         ) from last_error
@@ -177,15 +324,49 @@ class MistralProvider:
 
         content = str(response.choices[0].message.content) or "{}"
         try:
-            data = json.loads(content)
+            cities = json.loads(content).get("cities")
             # Sanitize and truncate city data before validation
-            if "cities" in data:
-                data["cities"] = [
-                    truncate_city_strings(_sanitize_city_data(c))
-                    for c in data["cities"]
-                ]
-            cities_response = CitiesResponse(**data)
-            return cities_response.cities
+            if isinstance(cities, list):
+                cities = [truncate_city_strings(_sanitize_city_data(c)) for c in cities]
+            return _city_list_adapter().validate_python(cities)
+        except (json.JSONDecodeError, ValidationError) as e:
+            raise ValueError(f"Failed to parse cities info: {e}") from e
+
+    def get_cities_info_stream(self, country_name: str) -> Iterator[CityInfo]:
+        """Stream structured city information from Mistral.
+
+        Yields each city as soon as its JSON object has been received,
+        instead of waiting for the full response.
+
+        Raises:
+            ValueError: If the streamed response cannot be parsed.
+        """
+        stream = self.client.chat.stream(
+            model=self.model,
+            messages=[  # type: ignore[arg-type]
+                {"role": "system", "content": CITY_SYSTEM_PROMPT},
+                {"role": "user", "content": get_cities_user_prompt(country_name)},
+            ],
+            response_format={"type": "json_object"},
+        )
+
+        def text_chunks() -> Iterator[str]:
+            for event in stream:
+                content = event.data.choices[0].delta.content
+                if isinstance(content, str):
+                    yield content
+
+        try:
+            for count, city in enumerate(
+                _iter_json_array_items(text_chunks(), "cities"), start=1
+            ):
+                if count > MAX_CITIES:
+                    raise ValueError(
+                        f"Failed to parse cities info: more than {MAX_CITIES} cities"
+                    )
+                yield CityInfo.model_validate(
+                    truncate_city_strings(_sanitize_city_data(city))
+                )
         except (json.JSONDecodeError, ValidationError) as e:
             raise ValueError(f"Failed to parse cities info: {e}") from e
 
@@ -200,7 +381,7 @@ class MistralProvider:
             except Exception as e:
                 last_error = e
                 if attempt < max_retries - 1:
-                    time.sleep(RETRY_DELAY)
+                    time.sleep(backoff_delay(attempt, RETRY_DELAY))
         raise ValueError(
             f"Failed after {max_retries} retries: {last_error}"
         ) from last_error
@@ -3,6 +3,9 @@
 import json
 import os
 import time
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
 
 from dotenv import load_dotenv
 from openai import OpenAI
@@ -22,10 +25,21 @@ from process_structured_output.prompts import (
     truncate_city_strings,
     truncate_country_strings,
 )
+from process_structured_output.providers.retry import RETRY_MAX_DELAY, backoff_delay
 
-# Retry configuration
+# Prefer orjson (the "fast" extra) for parsing responses when it is installed;
+# its decode error subclasses json.JSONDecodeError, so errors map the same way
+_loads: Callable[[str | bytes], Any]
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Retry configuration (exponential backoff with jitter)
 MAX_RETRIES = 3
-RETRY_DELAY = 1.0
+RETRY_BASE_DELAY = 0.5
 
 
 def _sanitize_city_data(city: dict) -> dict:
@@ -47,15 +61,80 @@ def _sanitize_city_data(city: dict) -> dict:
     return city
 
 
+# Parsed responses are cached per content string so identical payloads (batch
+# re-runs, repeated lookups) skip decoding and validation. The models are
+# frozen, so sharing cached instances between callers is safe.
+@lru_cache(maxsize=256)
+def _parse_country_info(content: str) -> CountryInfo:
+    """Parse and validate a country info response.
+
+    Args:
+        content: JSON response content from OpenAI
+
+    Returns:
+        Validated CountryInfo
+
+    Raises:
+        ValueError: If the content is empty, not JSON, or fails validation
+    """
+    try:
+        data = _loads(content)
+        if not data:
+            raise ValueError("Empty JSON response from OpenAI")
+        # Truncate strings to enforce character limits
+        data = truncate_country_strings(data)
+        return CountryInfo.model_validate(data)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Failed to parse country info: {e}") from e
+    except ValidationError as e:
+        raise ValueError(f"Failed to parse country info: {e}") from e
+
+
+@lru_cache(maxsize=256)
+def _parse_cities_info(content: str) -> tuple[CityInfo, ...]:
+    """Parse and validate a cities info response.
+
+    Args:
+        content: JSON response content from OpenAI
+
+    Returns:
+        Validated cities, as a tuple so the cached value cannot be mutated
+
+    Raises:
+        ValueError: If the content is not JSON or fails validation
+    """
+    try:
+        data = _loads(content)
+        # Sanitize and truncate each city before validation
+        if "cities" in data:
+            data["cities"] = [
+                truncate_city_strings(_sanitize_city_data(c)) for c in data["cities"]
+            ]
+        cities_response = CitiesResponse(**data)
+        return tuple(cities_response.cities)
+    except (json.JSONDecodeError, ValidationError) as e:
+        raise ValueError(f"Failed to parse cities info: {e}") from e
+
+
 class OpenAIProvider:
     """OpenAI API provider for structured continent information."""
 
-    def __init__(self, api_key: str | None = None) -> None:
+    def __init__(
+        self,
+        api_key: str | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+        base_delay: float = RETRY_BASE_DELAY,
+        max_delay: float = RETRY_MAX_DELAY,
+    ) -> None:
         """
         Initialize OpenAI provider.
 
         Args:
             api_key: OpenAI API key. If not provided, reads from env var.
+            sleep: Function used to wait between retries (injectable so
+                tests can skip real delays).
+            base_delay: Retry delay after the first failure, in seconds.
+            max_delay: Upper bound on the retry delay, in seconds.
         """
         load_dotenv()
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
@@ -63,6 +142,9 @@ class OpenAIProvider:
             raise ValueError("OPENAI_API_KEY environment variable not set")
         self.client = OpenAI(api_key=self.api_key)
         self.model = "gpt-4o"
+        self._sleep = sleep
+        self.base_delay = base_delay
+        self.max_delay = max_delay
 
     def get_model_identity(self) -> ModelIdentity:
         """
@@ -135,9 +217,9 @@ class OpenAIProvider:
         content = response.choices[0].message.content or "{}"
 
         try:
-            data = json.loads(content)
-            return ContinentInfo(**data)
-        except (json.JSONDecodeError, ValidationError) as e:
+            # Parse and validate in one pydantic-core pass
+            return ContinentInfo.model_validate_json(content)
+        except ValidationError as e:
             raise ValueError(f"Failed to parse continent info: {e}") from e
 
     def get_country_info(self, country_name: str) -> CountryInfo:
@@ -152,17 +234,7 @@ class OpenAIProvider:
         )
 
         content = response.choices[0].message.content or "{}"
-        try:
-            data = json.loads(content)
-            if not data:
-                raise ValueError("Empty JSON response from OpenAI")
-            # Truncate strings to enforce character limits
-            data = truncate_country_strings(data)
-            return CountryInfo(**data)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Failed to parse country info: {e}") from e
-        except ValidationError as e:
-            raise ValueError(f"Failed to parse country info: {e}") from e
+        return _parse_country_info(content)
 
     def get_country_info_with_retry(
         self, country_name: str, max_retries: int = MAX_RETRIES
@@ -175,7 +247,7 @@ class OpenAIProvider:
             except Exception as e:
                 last_error = e
                 if attempt < max_retries - 1:
-                    time.sleep(RETRY_DELAY)
+                    self._sleep(backoff_delay(attempt, self.base_delay, self.max_delay))
         raise ValueError(
             f"Failed after {max_retries} retries: {last_error}"
         ) from last_error
@@ -192,18 +264,7 @@ class OpenAIProvider:
         )
 
         content = response.choices[0].message.content or "{}"
-        try:
-            data = json.loads(content)
-            # Sanitize and truncate each city before validation
-            if "cities" in data:
-                data["cities"] = [
-                    truncate_city_strings(_sanitize_city_data(c))
-                    for c in data["cities"]
-                ]
-            cities_response = CitiesResponse(**data)
-            return cities_response.cities
-        except (json.JSONDecodeError, ValidationError) as e:
-            raise ValueError(f"Failed to parse cities info: {e}") from e
+        return list(_parse_cities_info(content))
 
     def get_cities_info_with_retry(
         self, country_name: str, max_retries: int = MAX_RETRIES
@@ -216,7 +277,7 @@ class OpenAIProvider:
             except Exception as e:
                 last_error = e
                 if attempt < max_retries - 1:
-                    time.sleep(RETRY_DELAY)
+                    self._sleep(backoff_delay(attempt, self.base_delay, self.max_delay))
         raise ValueError(
             f"Failed after {max_retries} retries: {last_error}"
         ) from last_error
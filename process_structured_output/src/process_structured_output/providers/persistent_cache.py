@@ -0,0 +1,121 @@
+"""Disk-backed cache for LLM responses.
+
+Stores serialized responses in a SQLite database so repeated runs (e.g.,
+iterating on prompts or re-running batch jobs) reuse earlier answers
+instead of re-querying the provider.
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from types import TracebackType
+from typing import Self
+
+# Default cache location and entry lifetime
+DEFAULT_CACHE_PATH = (
+    Path.home() / ".cache" / "process_structured_output" / "responses.sqlite3"
+)
+DEFAULT_EXPIRE_SECONDS = 86400.0
+
+
+class PersistentCache:
+    """SQLite-backed key/value cache with per-entry expiry.
+
+    Expired entries are deleted each time the cache is opened, so the
+    database does not grow without bound. Use as a context manager (or call
+    close()) to release the connection.
+
+    One instance may be shared between threads: the connection is opened
+    with check_same_thread=False and every statement runs under a lock.
+    """
+
+    def __init__(
+        self,
+        path: Path | str | None = None,
+        expire: float | None = DEFAULT_EXPIRE_SECONDS,
+    ) -> None:
+        """Open (or create) the cache database.
+
+        Args:
+            path: Database file path. Defaults to DEFAULT_CACHE_PATH.
+            expire: Seconds an entry stays valid. None means never expire.
+        """
+        self.path = Path(path).expanduser() if path else DEFAULT_CACHE_PATH
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.expire = expire
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+            )
+        self.purge_expired()
+
+    def __enter__(self) -> Self:
+        """Return the cache for use in a with block."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Close the connection when the with block exits."""
+        self.close()
+
+    def get(self, key: str) -> str | None:
+        """Return the cached value for a key, or None if missing or expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM cache "
+                "WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (key, time.time()),
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: str) -> None:
+        """Store a value under a key, replacing any existing entry.
+
+        Args:
+            key: Cache key
+            value: Serialized value to store
+        """
+        expires_at = time.time() + self.expire if self.expire is not None else None
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) "
+                "VALUES (?, ?, ?)",
+                (key, value, expires_at),
+            )
+
+    def purge_expired(self) -> int:
+        """Delete entries whose expiry time has passed.
+
+        Returns:
+            Number of entries deleted
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM cache WHERE expires_at <= ?", (time.time(),)
+            )
+        return cursor.rowcount
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM cache")
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,31 @@
+"""Retry backoff shared by the LLM providers.
+
+Retrying at a fixed interval makes every client that failed together retry
+together. Providers instead wait an exponentially growing, jittered delay
+between attempts.
+"""
+
+import random
+
+# Upper bound on the backoff delay before jitter, in seconds
+RETRY_MAX_DELAY = 20.0
+
+
+def backoff_delay(
+    attempt: int, base_delay: float, max_delay: float = RETRY_MAX_DELAY
+) -> float:
+    """Return the wait before the retry following a failed attempt.
+
+    The delay doubles with each attempt up to max_delay, plus up to 10%
+    random jitter so concurrent clients do not retry in lockstep.
+
+    Args:
+        attempt: Zero-based index of the attempt that just failed
+        base_delay: Delay after the first failure, in seconds
+        max_delay: Upper bound on the delay before jitter, in seconds
+
+    Returns:
+        Delay in seconds
+    """
+    delay = min(max_delay, base_delay * 2.0**attempt)
+    return delay + random.uniform(0, 0.1 * delay)
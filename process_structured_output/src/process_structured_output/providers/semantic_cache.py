@@ -0,0 +1,140 @@
+"""Semantic cache for near-duplicate LLM queries.
+
+Exact-match caches miss on trivially rephrased lookups such as "Algeria",
+"algeria" and "the country Algeria". This cache keys entries by an embedding
+of the query and returns a stored response when the cosine similarity to a
+previous query meets a threshold.
+
+Queries that are equal after case folding and whitespace collapsing are
+answered from an exact-key index without calling the embedding function.
+Near-duplicate names such as "Niger" and "Nigeria" only stay apart if the
+embedding scores them below the threshold, so check the threshold against
+the embedding model in use before raising it above the default.
+"""
+
+import math
+import operator
+from collections.abc import Callable, Sequence
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+# Default cosine similarity required for two queries to share a cache slot
+DEFAULT_SIMILARITY_THRESHOLD = 0.95
+
+
+def _normalize(vector: Sequence[float]) -> list[float]:
+    """Scale a vector to unit length.
+
+    Args:
+        vector: Embedding vector
+
+    Returns:
+        Unit-length copy of the vector (all zeros if the input has no length)
+    """
+    norm = math.sqrt(sum(x * x for x in vector))
+    if norm == 0.0:
+        return [0.0] * len(vector)
+    return [x / norm for x in vector]
+
+
+def _query_key(query: str) -> str:
+    """Return the exact-match key for a query (case-folded, single-spaced)."""
+    return " ".join(query.casefold().split())
+
+
+class SemanticCache(Generic[T]):
+    """Cache that matches queries by embedding cosine similarity.
+
+    Embeddings are normalized once on insert so a lookup is a single dot
+    product per cached entry instead of a full cosine computation.
+    """
+
+    def __init__(
+        self,
+        embedding_fn: Callable[[str], Sequence[float]],
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+    ) -> None:
+        """Initialize the semantic cache.
+
+        Args:
+            embedding_fn: Function returning an embedding vector for a query.
+            threshold: Minimum cosine similarity (0.0 to 1.0) for a hit.
+        """
+        if not 0.0 <= threshold <= 1.0:
+            raise ValueError(f"threshold ({threshold}) must be between 0.0 and 1.0")
+        self.embedding_fn = embedding_fn
+        self.threshold = threshold
+        self._embeddings: list[list[float]] = []
+        self._values: list[T] = []
+        # Exact-match key -> index into _values, checked before embedding
+        self._keys: dict[str, int] = {}
+        # Last embedded query, reused by set() after a get() miss
+        self._last_query: str | None = None
+        self._last_embedding: list[float] = []
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._values)
+
+    def _embed(self, query: str) -> list[float]:
+        """Return the normalized embedding for a query."""
+        if query != self._last_query:
+            self._last_embedding = _normalize(self.embedding_fn(query))
+            self._last_query = query
+        return self._last_embedding
+
+    def get(self, query: str) -> T | None:
+        """Return the cached value for the most similar query, if any.
+
+        Args:
+            query: Query text to look up
+
+        Returns:
+            Cached value if a stored query meets the threshold, else None
+        """
+        if not self._values:
+            return None
+
+        index = self._keys.get(_query_key(query))
+        if index is not None:
+            return self._values[index]
+
+        embedding = self._embed(query)
+        best_index = -1
+        best_score = self.threshold
+        for index, stored in enumerate(self._embeddings):
+            score = sum(map(operator.mul, stored, embedding))
+            if score >= best_score:
+                best_index, best_score = index, score
+
+        if best_index < 0:
+            return None
+        return self._values[best_index]
+
+    def set(self, query: str, value: T) -> None:
+        """Store a value under the embedding of a query.
+
+        A query whose exact-match key is already cached replaces that entry's
+        value instead of adding a second entry.
+
+        Args:
+            query: Query text the value answers
+            value: Value to cache
+        """
+        key = _query_key(query)
+        index = self._keys.get(key)
+        if index is not None:
+            self._values[index] = value
+            return
+        self._keys[key] = len(self._values)
+        self._embeddings.append(self._embed(query))
+        self._values.append(value)
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        self._embeddings.clear()
+        self._values.clear()
+        self._keys.clear()
+        self._last_query = None
+        self._last_embedding = []
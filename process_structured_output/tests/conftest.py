@@ -0,0 +1,39 @@
+"""Shared pytest fixtures for provider tests."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _mistral_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Provide a test Mistral API key."""
+    monkeypatch.setenv("MISTRAL_API_KEY", "test-key")
+
+
+@pytest.fixture(autouse=True)
+def _openai_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Provide a test OpenAI API key."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+
+@pytest.fixture
+def mock_mistral(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace the Mistral SDK client with a MagicMock and return it."""
+    client = MagicMock()
+    monkeypatch.setattr(
+        "process_structured_output.providers.mistral_provider.Mistral",
+        lambda **kwargs: client,
+    )
+    return client
+
+
+@pytest.fixture
+def mock_openai(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace the OpenAI SDK client with a MagicMock and return it."""
+    client = MagicMock()
+    monkeypatch.setattr(
+        "process_structured_output.providers.openai_provider.OpenAI",
+        lambda **kwargs: client,
+    )
+    return client
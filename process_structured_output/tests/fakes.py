@@ -0,0 +1,61 @@
+"""Lightweight fakes for LLM client responses used in tests."""
+
+import json
+from typing import Any, NamedTuple
+
+
+class _Msg(NamedTuple):
+    """Chat message carrying response content."""
+
+    content: str
+
+
+class _Choice(NamedTuple):
+    """Single completion choice."""
+
+    message: _Msg
+
+
+class _Resp(NamedTuple):
+    """Chat completion response."""
+
+    choices: list[_Choice]
+
+
+def fake_response(content: str) -> _Resp:
+    """Build a chat completion response exposing choices[0].message.content."""
+    return _Resp([_Choice(_Msg(content))])
+
+
+def fake_json_response(payload: dict[str, Any]) -> _Resp:
+    """Build a chat completion response whose content is a JSON payload."""
+    return fake_response(json.dumps(payload))
+
+
+class _Delta(NamedTuple):
+    """Incremental message content in a streamed chunk."""
+
+    content: str
+
+
+class _StreamChoice(NamedTuple):
+    """Single choice in a streamed chunk."""
+
+    delta: _Delta
+
+
+class _Chunk(NamedTuple):
+    """Streamed completion chunk."""
+
+    choices: list[_StreamChoice]
+
+
+class _Event(NamedTuple):
+    """Stream event wrapping a completion chunk."""
+
+    data: _Chunk
+
+
+def fake_stream(*contents: str) -> list[_Event]:
+    """Build stream events exposing data.choices[0].delta.content."""
+    return [_Event(_Chunk([_StreamChoice(_Delta(c))])) for c in contents]
@@ -62,10 +62,10 @@ class TestCLI:
         )
 
         mock_provider = MagicMock()
-        mock_provider.get_model_identity.return_value = ModelIdentity(
+        mock_provider.get_model_identity.return_value = ModelIdentity.model_construct(
             model_provider="OpenAI", model_name="gpt-4o"
         )
-        mock_provider.get_continent_info.return_value = ContinentInfo(
+        mock_provider.get_continent_info.return_value = ContinentInfo.model_construct(
             description="Test continent description for testing purposes",
             area_sq_mile=1000.0,
             area_sq_km=2590.0,
@@ -113,10 +113,10 @@ class TestCLI:
         )
 
         mock_provider = MagicMock()
-        mock_provider.get_model_identity.return_value = ModelIdentity(
+        mock_provider.get_model_identity.return_value = ModelIdentity.model_construct(
             model_provider="Google", model_name="gemini-2.5-flash"
         )
-        mock_provider.get_continent_info.return_value = ContinentInfo(
+        mock_provider.get_continent_info.return_value = ContinentInfo.model_construct(
             description="Test continent description for testing purposes",
             area_sq_mile=1000.0,
             area_sq_km=2590.0,
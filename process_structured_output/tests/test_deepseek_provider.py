@@ -1,6 +1,5 @@
 """Tests for DeepSeek provider using OpenAI-compatible API."""
 
-import json
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -11,6 +10,7 @@ from process_structured_output.providers.deepseek_provider import (
     RETRY_DELAY,
     DeepSeekProvider,
 )
+from tests.fakes import fake_json_response, fake_response
 
 
 class TestDeepSeekProviderInit:
@@ -74,9 +74,7 @@ class TestGetCountryInfo:
     @patch.dict("os.environ", {"DEEPSEEK_API_KEY": "test-key"})
     def test_get_country_info_parses_json_response(self) -> None:
         """Test get_country_info parses JSON response."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = json.dumps({
+        mock_response = fake_json_response({
             "description": "Test country",
             "interesting_fact": "A fun fact",
             "area_sq_mile": 356669.0,
@@ -118,9 +116,7 @@ class TestGetCountryInfo:
     @patch.dict("os.environ", {"DEEPSEEK_API_KEY": "test-key"})
     def test_get_country_info_uses_json_mode(self) -> None:
         """Test get_country_info uses JSON response format."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = json.dumps({
+        mock_response = fake_json_response({
             "description": "Test",
             "interesting_fact": "Fact",
             "area_sq_mile": 100.0,
@@ -162,9 +158,7 @@ class TestGetCountryInfo:
     @patch.dict("os.environ", {"DEEPSEEK_API_KEY": "test-key"})
     def test_get_country_info_raises_on_invalid_json(self) -> None:
         """Test get_country_info raises on invalid JSON response."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "Not valid JSON at all"
+        mock_response = fake_response("Not valid JSON at all")
 
         with patch(
             "process_structured_output.providers.deepseek_provider.OpenAI"
@@ -180,9 +174,7 @@ class TestGetCountryInfo:
     @patch.dict("os.environ", {"DEEPSEEK_API_KEY": "test-key"})
     def test_get_country_info_raises_on_empty_json(self) -> None:
         """Test get_country_info raises on empty JSON response."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "{}"
+        mock_response = fake_response("{}")
 
         with patch(
             "process_structured_output.providers.deepseek_provider.OpenAI"
@@ -202,9 +194,7 @@ class TestGetCitiesInfo:
     @patch.dict("os.environ", {"DEEPSEEK_API_KEY": "test-key"})
     def test_get_cities_info_parses_json_response(self) -> None:
         """Test get_cities_info parses JSON response."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = json.dumps({
+        mock_response = fake_json_response({
             "cities": [
                 {
                     "name": "Warsaw",
@@ -241,9 +231,7 @@ class TestGetCitiesInfo:
     @patch.dict("os.environ", {"DEEPSEEK_API_KEY": "test-key"})
     def test_get_cities_info_handles_multiple_cities(self) -> None:
         """Test get_cities_info handles multiple cities."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = json.dumps({
+        mock_response = fake_json_response({
             "cities": [
                 {
                     "name": "Warsaw",
@@ -293,9 +281,7 @@ class TestGetCitiesInfo:
     @patch.dict("os.environ", {"DEEPSEEK_API_KEY": "test-key"})
     def test_get_cities_info_raises_on_invalid_json(self) -> None:
         """Test get_cities_info raises on invalid JSON response."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "Not valid JSON"
+        mock_response = fake_response("Not valid JSON")
 
         with patch(
             "process_structured_output.providers.deepseek_provider.OpenAI"
@@ -318,9 +304,7 @@ class TestRetryLogic:
         self, mock_sleep: MagicMock
     ) -> None:
         """Test retry logic retries on transient failures."""
-        valid_response = MagicMock()
-        valid_response.choices = [MagicMock()]
-        valid_response.choices[0].message.content = json.dumps({
+        valid_response = fake_json_response({
             "description": "Test",
             "interesting_fact": "Fact",
             "area_sq_mile": 100.0,
@@ -346,9 +330,7 @@ class TestRetryLogic:
         })
 
         # First call fails with empty content, second succeeds
-        fail_response = MagicMock()
-        fail_response.choices = [MagicMock()]
-        fail_response.choices[0].message.content = "{}"
+        fail_response = fake_response("{}")
 
         with patch(
             "process_structured_output.providers.deepseek_provider.OpenAI"
@@ -365,15 +347,14 @@ class TestRetryLogic:
 
             assert info.description == "Test"
             assert mock_sleep.call_count == 1
-            mock_sleep.assert_called_with(RETRY_DELAY)
+            (delay,) = mock_sleep.call_args.args
+            assert RETRY_DELAY <= delay <= RETRY_DELAY * 1.1
 
     @patch.dict("os.environ", {"DEEPSEEK_API_KEY": "test-key"})
     @patch("process_structured_output.providers.deepseek_provider.time.sleep")
     def test_retry_fails_after_max_retries(self, mock_sleep: MagicMock) -> None:
         """Test retry gives up after max retries."""
-        fail_response = MagicMock()
-        fail_response.choices = [MagicMock()]
-        fail_response.choices[0].message.content = "{}"
+        fail_response = fake_response("{}")
 
         with patch(
             "process_structured_output.providers.deepseek_provider.OpenAI"
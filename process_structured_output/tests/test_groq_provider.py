@@ -1,6 +1,5 @@
 """Tests for Groq provider."""
 
-import json
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -10,6 +9,7 @@ from process_structured_output.providers.groq_provider import (
     RETRY_DELAY,
     GroqProvider,
 )
+from tests.fakes import fake_json_response, fake_response
 
 
 class TestGroqProviderInit:
@@ -58,9 +58,7 @@ class TestGetContinentInfo:
     @patch.dict("os.environ", {"GROQ_API_KEY": "test-key"})
     def test_get_continent_info_parses_json(self) -> None:
         """Test get_continent_info parses JSON response."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = json.dumps({
+        mock_response = fake_json_response({
             "description": "Test continent",
             "area_sq_mile": 1000000,
             "area_sq_km": 2590000,
@@ -84,9 +82,7 @@ class TestGetContinentInfo:
     @patch.dict("os.environ", {"GROQ_API_KEY": "test-key"})
     def test_get_continent_info_raises_on_invalid_json(self) -> None:
         """Test get_continent_info raises on invalid JSON."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "not json"
+        mock_response = fake_response("not json")
 
         with patch(
             "process_structured_output.providers.groq_provider.Groq"
@@ -106,9 +102,7 @@ class TestGetCountryInfo:
     @patch.dict("os.environ", {"GROQ_API_KEY": "test-key"})
     def test_get_country_info_parses_json_response(self) -> None:
         """Test get_country_info parses JSON response."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = json.dumps({
+        mock_response = fake_json_response({
             "description": "Test country",
             "interesting_fact": "A fun fact",
             "area_sq_mile": 356669.0,
@@ -150,9 +144,7 @@ class TestGetCountryInfo:
     @patch.dict("os.environ", {"GROQ_API_KEY": "test-key"})
     def test_get_country_info_uses_json_mode(self) -> None:
         """Test get_country_info uses JSON response format."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = json.dumps({
+        mock_response = fake_json_response({
             "description": "Test",
             "interesting_fact": "Fact",
             "area_sq_mile": 100.0,
@@ -194,9 +186,7 @@ class TestGetCountryInfo:
     @patch.dict("os.environ", {"GROQ_API_KEY": "test-key"})
     def test_get_country_info_raises_on_invalid_json(self) -> None:
         """Test get_country_info raises on invalid JSON response."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "Not valid JSON at all"
+        mock_response = fake_response("Not valid JSON at all")
 
         with patch(
             "process_structured_output.providers.groq_provider.Groq"
@@ -212,9 +202,7 @@ class TestGetCountryInfo:
     @patch.dict("os.environ", {"GROQ_API_KEY": "test-key"})
     def test_get_country_info_raises_on_empty_json(self) -> None:
         """Test get_country_info raises on empty JSON response."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "{}"
+        mock_response = fake_response("{}")
 
         with patch(
             "process_structured_output.providers.groq_provider.Groq"
@@ -234,9 +222,7 @@ class TestGetCitiesInfo:
     @patch.dict("os.environ", {"GROQ_API_KEY": "test-key"})
     def test_get_cities_info_parses_json_response(self) -> None:
         """Test get_cities_info parses JSON response."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = json.dumps({
+        mock_response = fake_json_response({
             "cities": [
                 {
                     "name": "Accra",
@@ -273,9 +259,7 @@ class TestGetCitiesInfo:
     @patch.dict("os.environ", {"GROQ_API_KEY": "test-key"})
     def test_get_cities_info_handles_multiple_cities(self) -> None:
         """Test get_cities_info handles multiple cities."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = json.dumps({
+        mock_response = fake_json_response({
             "cities": [
                 {
                     "name": "London",
@@ -325,9 +309,7 @@ class TestGetCitiesInfo:
     @patch.dict("os.environ", {"GROQ_API_KEY": "test-key"})
     def test_get_cities_info_raises_on_invalid_json(self) -> None:
         """Test get_cities_info raises on invalid JSON response."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "Not valid JSON"
+        mock_response = fake_response("Not valid JSON")
 
         with patch(
             "process_structured_output.providers.groq_provider.Groq"
@@ -350,9 +332,7 @@ class TestRetryLogic:
         self, mock_sleep: MagicMock
     ) -> None:
         """Test retry logic retries on transient failures."""
-        valid_response = MagicMock()
-        valid_response.choices = [MagicMock()]
-        valid_response.choices[0].message.content = json.dumps({
+        valid_response = fake_json_response({
             "description": "Test",
             "interesting_fact": "Fact",
             "area_sq_mile": 100.0,
@@ -378,9 +358,7 @@ class TestRetryLogic:
         })
 
         # First call fails with empty content, second succeeds
-        fail_response = MagicMock()
-        fail_response.choices = [MagicMock()]
-        fail_response.choices[0].message.content = "{}"
+        fail_response = fake_response("{}")
 
         with patch(
             "process_structured_output.providers.groq_provider.Groq"
@@ -397,15 +375,14 @@ class TestRetryLogic:
 
             assert info.description == "Test"
             assert mock_sleep.call_count == 1
-            mock_sleep.assert_called_with(RETRY_DELAY)
+            (delay,) = mock_sleep.call_args.args
+            assert RETRY_DELAY <= delay <= RETRY_DELAY * 1.1
 
     @patch.dict("os.environ", {"GROQ_API_KEY": "test-key"})
     @patch("process_structured_output.providers.groq_provider.time.sleep")
     def test_retry_fails_after_max_retries(self, mock_sleep: MagicMock) -> None:
         """Test retry gives up after max retries."""
-        fail_response = MagicMock()
-        fail_response.choices = [MagicMock()]
-        fail_response.choices[0].message.content = "{}"
+        fail_response = fake_response("{}")
 
         with patch(
             "process_structured_output.providers.groq_provider.Groq"
@@ -424,9 +401,7 @@ class TestRetryLogic:
         self, mock_sleep: MagicMock
     ) -> None:
         """Test cities retry logic retries on transient failures."""
-        valid_response = MagicMock()
-        valid_response.choices = [MagicMock()]
-        valid_response.choices[0].message.content = json.dumps({
+        valid_response = fake_json_response({
             "cities": [{
                 "name": "Test City",
                 "is_capital": True,
@@ -444,9 +419,7 @@ class TestRetryLogic:
         })
 
         # First call fails, second succeeds
-        fail_response = MagicMock()
-        fail_response.choices = [MagicMock()]
-        fail_response.choices[0].message.content = "invalid json"
+        fail_response = fake_response("invalid json")
 
         with patch(
             "process_structured_output.providers.groq_provider.Groq"
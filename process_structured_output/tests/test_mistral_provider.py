@@ -1,6 +1,8 @@
 """Tests for Mistral provider."""
 
 import json
+import sqlite3
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -10,29 +12,72 @@ from process_structured_output.providers.mistral_provider import (
     RETRY_DELAY,
     MistralProvider,
 )
+from tests.fakes import fake_json_response, fake_response, fake_stream
+
+_COUNTRY_DICT = {
+    "description": "Test",
+    "interesting_fact": "Fact",
+    "area_sq_mile": 100.0,
+    "area_sq_km": 259.0,
+    "population": 1000000,
+    "ppp": 1000.0,
+    "life_expectancy": 75.0,
+    "travel_risk_level": "Low",
+    "global_peace_index_score": 1.5,
+    "global_peace_index_rank": 20,
+    "happiness_index_score": 6.5,
+    "happiness_index_rank": 25,
+    "gdp": 100000000.0,
+    "gdp_growth_rate": 2.0,
+    "inflation_rate": 2.0,
+    "unemployment_rate": 5.0,
+    "govt_debt": 50.0,
+    "credit_rating": "AA",
+    "poverty_rate": 10.0,
+    "gini_coefficient": 30.0,
+    "military_spending": 2.0,
+    "gdp_per_capita": 100.0,
+}
+_VALID_COUNTRY_JSON = json.dumps(_COUNTRY_DICT)
+
+_CITY_DICT = {
+    "name": "Test City",
+    "is_capital": True,
+    "description": "Test",
+    "interesting_fact": "Fact",
+    "area_sq_mile": 100.0,
+    "area_sq_km": 259.0,
+    "population": 1000000,
+    "sci_score": None,
+    "sci_rank": None,
+    "numbeo_si": None,
+    "numbeo_ci": None,
+    "airport_code": "TST",
+}
+_VALID_CITY_JSON = json.dumps({"cities": [_CITY_DICT]})
 
 
 class TestMistralProviderInit:
     """Tests for MistralProvider initialization."""
 
-    @patch.dict("os.environ", {"MISTRAL_API_KEY": "test-key"})
-    def test_init_with_env_var(self) -> None:
+    def test_init_with_env_var(self, mock_mistral: MagicMock) -> None:
         """Test provider initializes with env var."""
-        with patch("process_structured_output.providers.mistral_provider.Mistral"):
-            provider = MistralProvider()
-            assert provider.api_key == "test-key"
-            assert provider.model == "mistral-large-latest"
+        provider = MistralProvider()
+        assert provider.api_key == "test-key"
+        assert provider.model == "mistral-large-latest"
 
-    def test_init_with_explicit_key(self) -> None:
+    def test_init_with_explicit_key(self, mock_mistral: MagicMock) -> None:
         """Test provider initializes with explicit key."""
-        with patch("process_structured_output.providers.mistral_provider.Mistral"):
-            provider = MistralProvider(api_key="explicit-key")
-            assert provider.api_key == "explicit-key"
+        provider = MistralProvider(api_key="explicit-key")
+        assert provider.api_key == "explicit-key"
 
-    @patch("process_structured_output.providers.mistral_provider.load_dotenv")
-    @patch.dict("os.environ", {}, clear=True)
-    def test_init_raises_without_key(self, mock_load_dotenv: MagicMock) -> None:
+    def test_init_raises_without_key(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test provider raises error without API key."""
+        monkeypatch.delenv("MISTRAL_API_KEY")
+        monkeypatch.setattr(
+            "process_structured_output.providers.mistral_provider.load_dotenv",
+            lambda: None,
+        )
         with pytest.raises(ValueError, match="MISTRAL_API_KEY"):
             MistralProvider()
 
@@ -40,27 +85,24 @@ class TestMistralProviderInit:
 class TestGetModelIdentity:
     """Tests for get_model_identity method."""
 
-    @patch.dict("os.environ", {"MISTRAL_API_KEY": "test-key"})
-    def test_get_model_identity_returns_hardcoded_values(self) -> None:
+    def test_get_model_identity_returns_hardcoded_values(
+        self, mock_mistral: MagicMock
+    ) -> None:
         """Test get_model_identity returns hardcoded provider and model name."""
-        with patch("process_structured_output.providers.mistral_provider.Mistral"):
-            provider = MistralProvider()
-            identity = provider.get_model_identity()
+        provider = MistralProvider()
+        identity = provider.get_model_identity()
 
-            # Hardcoded values - no API call made
-            assert identity.model_provider == "Mistral"
-            assert identity.model_name == "mistral-large-latest"
+        # Hardcoded values - no API call made
+        assert identity.model_provider == "Mistral"
+        assert identity.model_name == "mistral-large-latest"
 
 
 class TestGetContinentInfo:
     """Tests for get_continent_info method."""
 
-    @patch.dict("os.environ", {"MISTRAL_API_KEY": "test-key"})
-    def test_get_continent_info_parses_json(self) -> None:
+    def test_get_continent_info_parses_json(self, mock_mistral: MagicMock) -> None:
         """Test get_continent_info parses JSON response."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = json.dumps({
+        mock_response = fake_json_response({
             "description": "Test continent",
             "area_sq_mile": 1000000,
             "area_sq_km": 2590000,
@@ -68,175 +110,148 @@ class TestGetContinentInfo:
             "num_country": 50,
         })
 
-        with patch(
-            "process_structured_output.providers.mistral_provider.Mistral"
-        ) as mock_mistral:
-            mock_client = MagicMock()
-            mock_client.chat.complete.return_value = mock_response
-            mock_mistral.return_value = mock_client
+        mock_mistral.chat.complete.return_value = mock_response
 
-            provider = MistralProvider()
-            info = provider.get_continent_info("TestContinent")
+        provider = MistralProvider()
+        info = provider.get_continent_info("TestContinent")
 
-            assert info.description == "Test continent"
-            assert info.population == 500000000
+        assert info.description == "Test continent"
+        assert info.population == 500000000
 
-    @patch.dict("os.environ", {"MISTRAL_API_KEY": "test-key"})
-    def test_get_continent_info_raises_on_invalid_json(self) -> None:
+    def test_get_continent_info_raises_on_invalid_json(
+        self, mock_mistral: MagicMock
+    ) -> None:
         """Test get_continent_info raises on invalid JSON."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "not json"
+        mock_response = fake_response("not json")
 
-        with patch(
-            "process_structured_output.providers.mistral_provider.Mistral"
-        ) as mock_mistral:
-            mock_client = MagicMock()
-            mock_client.chat.complete.return_value = mock_response
-            mock_mistral.return_value = mock_client
+        mock_mistral.chat.complete.return_value = mock_response
 
-            provider = MistralProvider()
-            with pytest.raises(ValueError, match="Failed to parse"):
-                provider.get_continent_info("TestContinent")
+        provider = MistralProvider()
+        with pytest.raises(ValueError, match="Failed to parse"):
+            provider.get_continent_info("TestContinent")
 
 
 class TestGetCountryInfo:
     """Tests for get_country_info method."""
 
-    @patch.dict("os.environ", {"MISTRAL_API_KEY": "test-key"})
-    def test_get_country_info_parses_json_response(self) -> None:
+    def test_get_country_info_parses_json_response(
+        self, mock_mistral: MagicMock
+    ) -> None:
         """Test get_country_info parses JSON response."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = json.dumps({
-            "description": "Test country",
-            "interesting_fact": "A fun fact",
-            "area_sq_mile": 919595.0,
-            "area_sq_km": 2381741.0,
-            "population": 45000000,
-            "ppp": 12000.0,
-            "life_expectancy": 77.0,
-            "travel_risk_level": "Level 2",
-            "global_peace_index_score": 2.0,
-            "global_peace_index_rank": 100,
-            "happiness_index_score": 5.5,
-            "happiness_index_rank": 80,
-            "gdp": 180000000000.0,
-            "gdp_growth_rate": 2.5,
-            "inflation_rate": 6.0,
-            "unemployment_rate": 12.0,
-            "govt_debt": 60.0,
-            "credit_rating": "B+",
-            "poverty_rate": 25.0,
-            "gini_coefficient": 40.0,
-            "military_spending": 1.2,
-            "gdp_per_capita": 4000.0,
-        })
+        mock_response = fake_response(_VALID_COUNTRY_JSON)
 
-        with patch(
-            "process_structured_output.providers.mistral_provider.Mistral"
-        ) as mock_mistral:
-            mock_client = MagicMock()
-            mock_client.chat.complete.return_value = mock_response
-            mock_mistral.return_value = mock_client
+        mock_mistral.chat.complete.return_value = mock_response
 
-            provider = MistralProvider()
-            info = provider.get_country_info("Algeria")
+        provider = MistralProvider()
+        info = provider.get_country_info("Algeria")
 
-            assert info.description == "Test country"
-            assert info.population == 45000000
-            assert info.gdp == 180000000000.0
+        assert info.description == "Test"
+        assert info.population == 1000000
+        assert info.gdp == 100000000.0
 
-    @patch.dict("os.environ", {"MISTRAL_API_KEY": "test-key"})
-    def test_get_country_info_uses_json_mode(self) -> None:
+    def test_get_country_info_uses_json_mode(self, mock_mistral: MagicMock) -> None:
         """Test get_country_info uses JSON response format."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = json.dumps({
-            "description": "Test",
-            "interesting_fact": "Fact",
-            "area_sq_mile": 100.0,
-            "area_sq_km": 259.0,
-            "population": 1000000,
-            "ppp": 1000.0,
-            "life_expectancy": 75.0,
-            "travel_risk_level": "Low",
-            "global_peace_index_score": 1.5,
-            "global_peace_index_rank": 20,
-            "happiness_index_score": 6.5,
-            "happiness_index_rank": 25,
-            "gdp": 100000000.0,
-            "gdp_growth_rate": 2.0,
-            "inflation_rate": 2.0,
-            "unemployment_rate": 5.0,
-            "govt_debt": 50.0,
-            "credit_rating": "AA",
-            "poverty_rate": 10.0,
-            "gini_coefficient": 30.0,
-            "military_spending": 2.0,
-            "gdp_per_capita": 100.0,
-        })
+        mock_response = fake_response(_VALID_COUNTRY_JSON)
 
-        with patch(
-            "process_structured_output.providers.mistral_provider.Mistral"
-        ) as mock_mistral:
-            mock_client = MagicMock()
-            mock_client.chat.complete.return_value = mock_response
-            mock_mistral.return_value = mock_client
+        mock_mistral.chat.complete.return_value = mock_response
 
-            provider = MistralProvider()
-            provider.get_country_info("Belgium")
+        provider = MistralProvider()
+        provider.get_country_info("Belgium")
 
-            # Verify JSON mode was used
-            call_kwargs = mock_client.chat.complete.call_args[1]
-            assert call_kwargs["response_format"] == {"type": "json_object"}
+        # Verify JSON mode was used
+        call_kwargs = mock_mistral.chat.complete.call_args[1]
+        assert call_kwargs["response_format"] == {"type": "json_object"}
 
-    @patch.dict("os.environ", {"MISTRAL_API_KEY": "test-key"})
-    def test_get_country_info_raises_on_invalid_json(self) -> None:
+    def test_get_country_info_raises_on_invalid_json(
+        self, mock_mistral: MagicMock
+    ) -> None:
         """Test get_country_info raises on invalid JSON response."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "Not valid JSON at all"
-
-        with patch(
-            "process_structured_output.providers.mistral_provider.Mistral"
-        ) as mock_mistral:
-            mock_client = MagicMock()
-            mock_client.chat.complete.return_value = mock_response
-            mock_mistral.return_value = mock_client
-
-            provider = MistralProvider()
-            with pytest.raises(ValueError, match="Failed to parse"):
-                provider.get_country_info("Algeria")
-
-    @patch.dict("os.environ", {"MISTRAL_API_KEY": "test-key"})
-    def test_get_country_info_raises_on_empty_json(self) -> None:
+        mock_response = fake_response("Not valid JSON at all")
+
+        mock_mistral.chat.complete.return_value = mock_response
+
+        provider = MistralProvider()
+        with pytest.raises(ValueError, match="Failed to parse"):
+            provider.get_country_info("Algeria")
+
+    def test_get_country_info_raises_on_empty_json(
+        self, mock_mistral: MagicMock
+    ) -> None:
         """Test get_country_info raises on empty JSON response."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "{}"
+        mock_response = fake_response("{}")
+
+        mock_mistral.chat.complete.return_value = mock_response
+
+        provider = MistralProvider()
+        with pytest.raises(ValueError, match="Empty JSON response"):
+            provider.get_country_info("Algeria")
 
-        with patch(
-            "process_structured_output.providers.mistral_provider.Mistral"
-        ) as mock_mistral:
-            mock_client = MagicMock()
-            mock_client.chat.complete.return_value = mock_response
-            mock_mistral.return_value = mock_client
+    def test_get_country_info_raises_on_blank_content(
+        self, mock_mistral: MagicMock
+    ) -> None:
+        """Test whitespace-only content is treated as an empty response."""
+        mock_mistral.chat.complete.return_value = fake_response(" \n ")
+
+        provider = MistralProvider()
+        with pytest.raises(ValueError, match="Empty JSON response"):
+            provider.get_country_info("Algeria")
+
+    def test_get_country_info_semantic_cache_hit(self, mock_mistral: MagicMock) -> None:
+        """Test near-duplicate country names reuse the cached response."""
+        mock_response = fake_response(_VALID_COUNTRY_JSON)
+
+        def embed(text: str) -> list[float]:
+            lowered = text.lower()
+            return [float(lowered.count(c)) for c in "abcdefghijklmnopqrstuvwxyz"]
+
+        mock_mistral.chat.complete.return_value = mock_response
+
+        provider = MistralProvider(use_semantic_cache=True, embedding_fn=embed)
+        first = provider.get_country_info("Algeria")
+        second = provider.get_country_info("algeria")
 
-            provider = MistralProvider()
-            with pytest.raises(ValueError, match="Empty JSON response"):
-                provider.get_country_info("Algeria")
+        assert second is first
+        assert mock_mistral.chat.complete.call_count == 1
+
+    def test_get_country_info_persistent_cache_hit(
+        self, mock_mistral: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test a new provider reuses country info stored on disk."""
+        mock_mistral.chat.complete.return_value = fake_response(_VALID_COUNTRY_JSON)
+        path = tmp_path / "cache.sqlite3"
+
+        with MistralProvider(use_persistent_cache=True, cache_path=path) as first:
+            expected = first.get_country_info("Algeria")
+        with MistralProvider(use_persistent_cache=True, cache_path=path) as second:
+            result = second.get_country_info("Algeria")
+
+        assert result == expected
+        assert mock_mistral.chat.complete.call_count == 1
+
+    def test_close_releases_persistent_cache(
+        self, mock_mistral: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test leaving a with block closes the persistent cache."""
+        path = tmp_path / "cache.sqlite3"
+        with MistralProvider(use_persistent_cache=True, cache_path=path) as provider:
+            cache = provider.persistent_cache
+            assert cache is not None
+        assert provider.persistent_cache is None
+        with pytest.raises(sqlite3.ProgrammingError):
+            cache.get("key")
+        # Closing twice, or without a persistent cache, is harmless
+        provider.close()
+        MistralProvider().close()
 
 
 class TestGetCitiesInfo:
     """Tests for get_cities_info method."""
 
-    @patch.dict("os.environ", {"MISTRAL_API_KEY": "test-key"})
-    def test_get_cities_info_parses_json_response(self) -> None:
+    def test_get_cities_info_parses_json_response(
+        self, mock_mistral: MagicMock
+    ) -> None:
         """Test get_cities_info parses JSON response."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = json.dumps({
+        mock_response = fake_json_response({
             "cities": [
                 {
                     "name": "Algiers",
@@ -255,27 +270,21 @@ class TestGetCitiesInfo:
             ]
         })
 
-        with patch(
-            "process_structured_output.providers.mistral_provider.Mistral"
-        ) as mock_mistral:
-            mock_client = MagicMock()
-            mock_client.chat.complete.return_value = mock_response
-            mock_mistral.return_value = mock_client
+        mock_mistral.chat.complete.return_value = mock_response
 
-            provider = MistralProvider()
-            cities = provider.get_cities_info("Algeria")
+        provider = MistralProvider()
+        cities = provider.get_cities_info("Algeria")
 
-            assert len(cities) == 1
-            assert cities[0].name == "Algiers"
-            assert cities[0].is_capital is True
-            assert cities[0].population == 3500000
+        assert len(cities) == 1
+        assert cities[0].name == "Algiers"
+        assert cities[0].is_capital is True
+        assert cities[0].population == 3500000
 
-    @patch.dict("os.environ", {"MISTRAL_API_KEY": "test-key"})
-    def test_get_cities_info_handles_multiple_cities(self) -> None:
+    def test_get_cities_info_handles_multiple_cities(
+        self, mock_mistral: MagicMock
+    ) -> None:
         """Test get_cities_info handles multiple cities."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = json.dumps({
+        mock_response = fake_json_response({
             "cities": [
                 {
                     "name": "Brussels",
@@ -308,162 +317,155 @@ class TestGetCitiesInfo:
             ]
         })
 
-        with patch(
-            "process_structured_output.providers.mistral_provider.Mistral"
-        ) as mock_mistral:
-            mock_client = MagicMock()
-            mock_client.chat.complete.return_value = mock_response
-            mock_mistral.return_value = mock_client
+        mock_mistral.chat.complete.return_value = mock_response
 
-            provider = MistralProvider()
-            cities = provider.get_cities_info("Belgium")
+        provider = MistralProvider()
+        cities = provider.get_cities_info("Belgium")
 
-            assert len(cities) == 2
-            assert cities[0].name == "Brussels"
-            assert cities[1].name == "Antwerp"
+        assert len(cities) == 2
+        assert cities[0].name == "Brussels"
+        assert cities[1].name == "Antwerp"
 
-    @patch.dict("os.environ", {"MISTRAL_API_KEY": "test-key"})
-    def test_get_cities_info_raises_on_invalid_json(self) -> None:
+    def test_get_cities_info_raises_on_invalid_json(
+        self, mock_mistral: MagicMock
+    ) -> None:
         """Test get_cities_info raises on invalid JSON response."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "Not valid JSON"
+        mock_response = fake_response("Not valid JSON")
+
+        mock_mistral.chat.complete.return_value = mock_response
+
+        provider = MistralProvider()
+        with pytest.raises(ValueError, match="Failed to parse"):
+            provider.get_cities_info("Algeria")
+
+    def test_get_cities_info_raises_on_too_many_cities(
+        self, mock_mistral: MagicMock
+    ) -> None:
+        """Test get_cities_info enforces the maximum number of cities."""
+        mock_response = fake_json_response({"cities": [_CITY_DICT] * 6})
+
+        mock_mistral.chat.complete.return_value = mock_response
+
+        provider = MistralProvider()
+        with pytest.raises(ValueError, match="Failed to parse"):
+            provider.get_cities_info("Test")
+
+
+class TestGetCitiesInfoStream:
+    """Tests for get_cities_info_stream method."""
+
+    def test_yields_each_city_as_it_completes(self, mock_mistral: MagicMock) -> None:
+        """Test cities are yielded before the stream has finished."""
+        city1 = json.dumps({
+            "name": "Algiers",
+            "is_capital": True,
+            "description": "Capital of Algeria",
+            "interesting_fact": "Largest city",
+            "area_sq_mile": 105.0,
+            "area_sq_km": 273.0,
+            "population": 3500000,
+            "airport_code": "ALG",
+        })
+        city2 = json.dumps({
+            "name": "Oran",
+            "is_capital": False,
+            "description": "Port city",
+            "interesting_fact": "Second largest",
+            "area_sq_mile": 82.0,
+            "area_sq_km": 213.0,
+            "population": 1500000,
+            "airport_code": "",
+        })
+        chunks = ['{"cities": [', city1[:40], city1[40:], ", ", city2, "]}"]
+        consumed: list[str] = []
+
+        def stream(**kwargs: object) -> object:
+            for event in fake_stream(*chunks):
+                consumed.append(event.data.choices[0].delta.content)
+                yield event
+
+        mock_mistral.chat.stream.side_effect = stream
+
+        provider = MistralProvider()
+        cities = provider.get_cities_info_stream("Algeria")
 
-        with patch(
-            "process_structured_output.providers.mistral_provider.Mistral"
-        ) as mock_mistral:
-            mock_client = MagicMock()
-            mock_client.chat.complete.return_value = mock_response
-            mock_mistral.return_value = mock_client
+        first = next(cities)
+        assert first.name == "Algiers"
+        assert len(consumed) == 3
+        second = next(cities)
+        assert second.name == "Oran"
+        assert second.airport_code is None
+        assert list(cities) == []
 
-            provider = MistralProvider()
-            with pytest.raises(ValueError, match="Failed to parse"):
-                provider.get_cities_info("Algeria")
+    def test_raises_on_truncated_stream(self, mock_mistral: MagicMock) -> None:
+        """Test a stream ending mid-array raises."""
+        mock_mistral.chat.stream.return_value = fake_stream('{"cities": [{"na')
+
+        provider = MistralProvider()
+        with pytest.raises(ValueError, match="Failed to parse"):
+            list(provider.get_cities_info_stream("Algeria"))
 
 
 class TestRetryLogic:
     """Tests for retry logic in provider methods."""
 
-    @patch.dict("os.environ", {"MISTRAL_API_KEY": "test-key"})
     @patch("process_structured_output.providers.mistral_provider.time.sleep")
     def test_get_country_info_with_retry_retries_on_failure(
-        self, mock_sleep: MagicMock
+        self, mock_sleep: MagicMock, mock_mistral: MagicMock
     ) -> None:
         """Test retry logic retries on transient failures."""
-        valid_response = MagicMock()
-        valid_response.choices = [MagicMock()]
-        valid_response.choices[0].message.content = json.dumps({
-            "description": "Test",
-            "interesting_fact": "Fact",
-            "area_sq_mile": 100.0,
-            "area_sq_km": 259.0,
-            "population": 1000000,
-            "ppp": 1000.0,
-            "life_expectancy": 75.0,
-            "travel_risk_level": "Low",
-            "global_peace_index_score": 1.5,
-            "global_peace_index_rank": 20,
-            "happiness_index_score": 6.5,
-            "happiness_index_rank": 25,
-            "gdp": 100000000.0,
-            "gdp_growth_rate": 2.0,
-            "inflation_rate": 2.0,
-            "unemployment_rate": 5.0,
-            "govt_debt": 50.0,
-            "credit_rating": "AA",
-            "poverty_rate": 10.0,
-            "gini_coefficient": 30.0,
-            "military_spending": 2.0,
-            "gdp_per_capita": 100.0,
-        })
+        valid_response = fake_response(_VALID_COUNTRY_JSON)
 
         # First call fails with empty content, second succeeds
-        fail_response = MagicMock()
-        fail_response.choices = [MagicMock()]
-        fail_response.choices[0].message.content = "{}"
-
-        with patch(
-            "process_structured_output.providers.mistral_provider.Mistral"
-        ) as mock_mistral:
-            mock_client = MagicMock()
-            mock_client.chat.complete.side_effect = [
-                fail_response,
-                valid_response,
-            ]
-            mock_mistral.return_value = mock_client
+        fail_response = fake_response("{}")
 
-            provider = MistralProvider()
-            info = provider.get_country_info_with_retry("Belgium")
+        mock_mistral.chat.complete.side_effect = [
+            fail_response,
+            valid_response,
+        ]
 
-            assert info.description == "Test"
-            assert mock_sleep.call_count == 1
-            mock_sleep.assert_called_with(RETRY_DELAY)
+        provider = MistralProvider()
+        info = provider.get_country_info_with_retry("Belgium")
+
+        assert info.description == "Test"
+        assert mock_sleep.call_count == 1
+        (delay,) = mock_sleep.call_args.args
+        assert RETRY_DELAY <= delay <= RETRY_DELAY * 1.1
 
-    @patch.dict("os.environ", {"MISTRAL_API_KEY": "test-key"})
     @patch("process_structured_output.providers.mistral_provider.time.sleep")
-    def test_retry_fails_after_max_retries(self, mock_sleep: MagicMock) -> None:
+    def test_retry_fails_after_max_retries(
+        self, mock_sleep: MagicMock, mock_mistral: MagicMock
+    ) -> None:
         """Test retry gives up after max retries."""
-        fail_response = MagicMock()
-        fail_response.choices = [MagicMock()]
-        fail_response.choices[0].message.content = "{}"
-
-        with patch(
-            "process_structured_output.providers.mistral_provider.Mistral"
-        ) as mock_mistral:
-            mock_client = MagicMock()
-            mock_client.chat.complete.return_value = fail_response
-            mock_mistral.return_value = mock_client
-
-            provider = MistralProvider()
-            with pytest.raises(ValueError, match=f"Failed after {MAX_RETRIES}"):
-                provider.get_country_info_with_retry("Belgium")
-
-    @patch.dict("os.environ", {"MISTRAL_API_KEY": "test-key"})
+        fail_response = fake_response("{}")
+
+        mock_mistral.chat.complete.return_value = fail_response
+
+        provider = MistralProvider()
+        with pytest.raises(ValueError, match=f"Failed after {MAX_RETRIES}"):
+            provider.get_country_info_with_retry("Belgium")
+
     @patch("process_structured_output.providers.mistral_provider.time.sleep")
     def test_get_cities_info_with_retry_retries_on_failure(
-        self, mock_sleep: MagicMock
+        self, mock_sleep: MagicMock, mock_mistral: MagicMock
     ) -> None:
         """Test cities retry logic retries on transient failures."""
-        valid_response = MagicMock()
-        valid_response.choices = [MagicMock()]
-        valid_response.choices[0].message.content = json.dumps({
-            "cities": [{
-                "name": "Test City",
-                "is_capital": True,
-                "description": "Test",
-                "interesting_fact": "Fact",
-                "area_sq_mile": 100.0,
-                "area_sq_km": 259.0,
-                "population": 1000000,
-                "sci_score": None,
-                "sci_rank": None,
-                "numbeo_si": None,
-                "numbeo_ci": None,
-                "airport_code": "TST",
-            }]
-        })
+        valid_response = fake_response(_VALID_CITY_JSON)
 
         # First call fails, second succeeds
-        fail_response = MagicMock()
-        fail_response.choices = [MagicMock()]
-        fail_response.choices[0].message.content = "invalid json"
-
-        with patch(
-            "process_structured_output.providers.mistral_provider.Mistral"
-        ) as mock_mistral:
-            mock_client = MagicMock()
-            mock_client.chat.complete.side_effect = [
-                fail_response,
-                valid_response,
-            ]
-            mock_mistral.return_value = mock_client
+        fail_response = fake_response("invalid json")
+
+        mock_mistral.chat.complete.side_effect = [
+            fail_response,
+            valid_response,
+        ]
 
-            provider = MistralProvider()
-            cities = provider.get_cities_info_with_retry("Test")
+        provider = MistralProvider()
+        cities = provider.get_cities_info_with_retry("Test")
 
-            assert len(cities) == 1
-            assert cities[0].name == "Test City"
-            assert mock_sleep.call_count == 1
+        assert len(cities) == 1
+        assert cities[0].name == "Test City"
+        assert mock_sleep.call_count == 1
 
 
 class TestConstants:
@@ -1,5 +1,7 @@
 """Tests for Pydantic models."""
 
+from typing import Any
+
 import pytest
 from pydantic import ValidationError
 
@@ -10,6 +12,52 @@ from process_structured_output.models.country import (
     CountryInfo,
 )
 
+# Known-valid keyword arguments; invalid-value tests override single fields
+_COUNTRY_KWARGS: dict[str, Any] = {
+    "description": "Test",
+    "interesting_fact": "Test",
+    "area_sq_mile": 1000.0,
+    "area_sq_km": 1000.0,
+    "population": 1000,
+    "ppp": 1000.0,
+    "life_expectancy": 70.0,
+    "travel_risk_level": "Level 1",
+    "global_peace_index_score": 1.0,
+    "global_peace_index_rank": 1,
+    "happiness_index_score": 5.0,
+    "happiness_index_rank": 1,
+    "gdp": 1000.0,
+    "gdp_growth_rate": 1.0,
+    "inflation_rate": 1.0,
+    "unemployment_rate": 1.0,
+    "govt_debt": 1.0,
+    "credit_rating": "AAA",
+    "poverty_rate": 1.0,
+    "gini_coefficient": 30.0,
+    "military_spending": 1.0,
+    "gdp_per_capita": 1000.0,
+}
+
+_CITY_KWARGS: dict[str, Any] = {
+    "name": "Lagos",
+    "is_capital": False,
+    "description": "Test",
+    "interesting_fact": "Test",
+    "area_sq_mile": 452.0,
+    "area_sq_km": 1171.0,
+    "population": 15000000,
+    "airport_code": "LOS",
+}
+
+# Validated once and shared by tests that only need some valid city
+_SAMPLE_CITY = CityInfo(**_CITY_KWARGS)
+
+
+@pytest.fixture(scope="module")
+def sample_city() -> CityInfo:
+    """Return a shared, already-validated CityInfo."""
+    return _SAMPLE_CITY
+
 
 class TestModelIdentity:
     """Tests for ModelIdentity model."""
@@ -37,6 +85,12 @@ class TestModelIdentity:
         with pytest.raises(ValidationError):
             ModelIdentity(model_provider="OpenAI")  # type: ignore
 
+    def test_model_identity_is_frozen(self) -> None:
+        """Test ModelIdentity rejects attribute assignment."""
+        identity = ModelIdentity(model_provider="OpenAI", model_name="gpt-4o")
+        with pytest.raises(ValidationError):
+            identity.model_name = "gpt-4o-mini"  # type: ignore[misc]
+
 
 class TestContinentInfo:
     """Tests for ContinentInfo model."""
@@ -123,61 +177,17 @@ class TestCountryInfo:
         assert info.gdp == 450000000000.0
         assert info.gdp_per_capita == 2045.0
 
-    def test_country_info_positive_values(self) -> None:
-        """Test CountryInfo requires positive values for area."""
-        with pytest.raises(ValidationError):
-            CountryInfo(
-                description="Test",
-                interesting_fact="Test",
-                area_sq_mile=-1.0,  # Invalid: must be > 0
-                area_sq_km=1000.0,
-                population=1000,
-                ppp=1000.0,
-                life_expectancy=70.0,
-                travel_risk_level="Level 1",
-                global_peace_index_score=1.0,
-                global_peace_index_rank=1,
-                happiness_index_score=5.0,
-                happiness_index_rank=1,
-                gdp=1000.0,
-                gdp_growth_rate=1.0,
-                inflation_rate=1.0,
-                unemployment_rate=1.0,
-                govt_debt=1.0,
-                credit_rating="AAA",
-                poverty_rate=1.0,
-                gini_coefficient=30.0,
-                military_spending=1.0,
-                gdp_per_capita=1000.0,
-            )
-
-    def test_country_info_description_max_length(self) -> None:
-        """Test CountryInfo respects description max length."""
+    @pytest.mark.parametrize(
+        "override",
+        [
+            {"area_sq_mile": -1.0},  # Invalid: must be > 0
+            {"description": "x" * 251},  # Invalid: max 250
+        ],
+    )
+    def test_country_info_invalid(self, override: dict[str, Any]) -> None:
+        """Test CountryInfo rejects out-of-range values."""
         with pytest.raises(ValidationError):
-            CountryInfo(
-                description="x" * 251,  # Invalid: max 250
-                interesting_fact="Test",
-                area_sq_mile=1000.0,
-                area_sq_km=1000.0,
-                population=1000,
-                ppp=1000.0,
-                life_expectancy=70.0,
-                travel_risk_level="Level 1",
-                global_peace_index_score=1.0,
-                global_peace_index_rank=1,
-                happiness_index_score=5.0,
-                happiness_index_rank=1,
-                gdp=1000.0,
-                gdp_growth_rate=1.0,
-                inflation_rate=1.0,
-                unemployment_rate=1.0,
-                govt_debt=1.0,
-                credit_rating="AAA",
-                poverty_rate=1.0,
-                gini_coefficient=30.0,
-                military_spending=1.0,
-                gdp_per_capita=1000.0,
-            )
+            CountryInfo(**{**_COUNTRY_KWARGS, **override})
 
 
 class TestCityInfo:
@@ -204,35 +214,26 @@ class TestCityInfo:
         assert info.population == 15000000
         assert info.airport_code == "LOS"
 
-    def test_city_info_airport_code_length(self) -> None:
-        """Test CityInfo requires 3-letter airport code."""
+    @pytest.mark.parametrize(
+        "override",
+        [
+            {"airport_code": "LA"},  # Invalid: must be 3 letters
+            {"area_sq_mile": -1.0},  # Invalid: must be > 0
+        ],
+    )
+    def test_city_info_invalid(self, override: dict[str, Any]) -> None:
+        """Test CityInfo rejects out-of-range values."""
         with pytest.raises(ValidationError):
-            CityInfo(
-                name="Lagos",
-                is_capital=False,
-                description="Test",
-                interesting_fact="Test",
-                area_sq_mile=452.0,
-                area_sq_km=1171.0,
-                population=15000000,
-                airport_code="LA",  # Invalid: must be 3 letters
-            )
+            CityInfo(**{**_CITY_KWARGS, **override})
 
     def test_city_info_optional_safety_indices(self) -> None:
         """Test CityInfo allows None for safety indices."""
         info = CityInfo(
-            name="Lagos",
-            is_capital=False,
-            description="Test",
-            interesting_fact="Test",
-            area_sq_mile=452.0,
-            area_sq_km=1171.0,
-            population=15000000,
+            **_CITY_KWARGS,
             sci_score=None,
             sci_rank=None,
             numbeo_si=None,
             numbeo_ci=None,
-            airport_code="LOS",
         )
         assert info.sci_score is None
         assert info.numbeo_si is None
@@ -241,35 +242,17 @@ class TestCityInfo:
 class TestCitiesResponse:
     """Tests for CitiesResponse model."""
 
-    def test_valid_cities_response(self) -> None:
+    def test_valid_cities_response(self, sample_city: CityInfo) -> None:
         """Test creating valid CitiesResponse."""
-        city = CityInfo(
-            name="Lagos",
-            is_capital=False,
-            description="Economic hub",
-            interesting_fact="Largest city",
-            area_sq_mile=452.0,
-            area_sq_km=1171.0,
-            population=15000000,
-            airport_code="LOS",
-        )
-        response = CitiesResponse(cities=[city])
+        response = CitiesResponse(cities=[sample_city])
         assert len(response.cities) == 1
         assert response.cities[0].name == "Lagos"
 
-    def test_cities_response_max_length(self) -> None:
+    def test_cities_response_max_length(self, sample_city: CityInfo) -> None:
         """Test CitiesResponse respects max 5 cities."""
+        # Only the list length is under test, so copy instead of revalidating
         cities = [
-            CityInfo(
-                name=f"City{i}",
-                is_capital=False,
-                description="Test",
-                interesting_fact="Test",
-                area_sq_mile=100.0,
-                area_sq_km=259.0,
-                population=1000000,
-                airport_code="XXX",
-            )
+            sample_city.model_copy(update={"name": f"City{i}"})
             for i in range(6)  # 6 cities exceeds max of 5
         ]
         with pytest.raises(ValidationError):
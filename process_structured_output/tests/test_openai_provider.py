@@ -1,471 +1,401 @@
 """Tests for OpenAI provider."""
 
 import json
-from unittest.mock import MagicMock, patch
+import subprocess
+import sys
+from collections.abc import Callable
+from unittest.mock import MagicMock
 
 import pytest
 
+from process_structured_output.providers import openai_provider
 from process_structured_output.providers.openai_provider import (
     MAX_RETRIES,
-    RETRY_DELAY,
+    RETRY_BASE_DELAY,
     OpenAIProvider,
 )
+from tests.fakes import fake_response
+
+_VALID_CONTINENT_JSON = (
+    '{"description": "Test", "area_sq_mile": 1000.0, '
+    '"area_sq_km": 2590.0, "population": 1000000, '
+    '"num_country": 5}'
+)
+
+_VALID_COUNTRY_JSON = json.dumps({
+    "description": "Test",
+    "interesting_fact": "Fact",
+    "area_sq_mile": 100.0,
+    "area_sq_km": 259.0,
+    "population": 1000000,
+    "ppp": 1000.0,
+    "life_expectancy": 75.0,
+    "travel_risk_level": "Low",
+    "global_peace_index_score": 1.5,
+    "global_peace_index_rank": 20,
+    "happiness_index_score": 6.5,
+    "happiness_index_rank": 25,
+    "gdp": 100000000.0,
+    "gdp_growth_rate": 2.0,
+    "inflation_rate": 2.0,
+    "unemployment_rate": 5.0,
+    "govt_debt": 50.0,
+    "credit_rating": "AA",
+    "poverty_rate": 10.0,
+    "gini_coefficient": 30.0,
+    "military_spending": 2.0,
+    "gdp_per_capita": 100.0,
+})
+
+_FRANCE_JSON = json.dumps({
+    "description": "Test country",
+    "interesting_fact": "A fun fact",
+    "area_sq_mile": 356669.0,
+    "area_sq_km": 923768.0,
+    "population": 67000000,
+    "ppp": 45000.0,
+    "life_expectancy": 82.0,
+    "travel_risk_level": "Level 1",
+    "global_peace_index_score": 1.9,
+    "global_peace_index_rank": 65,
+    "happiness_index_score": 6.5,
+    "happiness_index_rank": 21,
+    "gdp": 2800000000000.0,
+    "gdp_growth_rate": 2.5,
+    "inflation_rate": 5.0,
+    "unemployment_rate": 7.0,
+    "govt_debt": 110.0,
+    "credit_rating": "AA",
+    "poverty_rate": 15.0,
+    "gini_coefficient": 32.0,
+    "military_spending": 2.1,
+    "gdp_per_capita": 41800.0,
+})
+
+_PARIS_JSON = json.dumps({
+    "cities": [
+        {
+            "name": "Paris",
+            "is_capital": True,
+            "description": "Capital of France",
+            "interesting_fact": "City of lights",
+            "area_sq_mile": 40.0,
+            "area_sq_km": 105.0,
+            "population": 2200000,
+            "sci_score": 82.0,
+            "sci_rank": 5,
+            "numbeo_si": 48.0,
+            "numbeo_ci": 52.0,
+            "airport_code": "CDG",
+        }
+    ]
+})
+
+_MULTI_CITY_JSON = json.dumps({
+    "cities": [
+        {
+            "name": "Paris",
+            "is_capital": True,
+            "description": "Capital",
+            "interesting_fact": "Fact 1",
+            "area_sq_mile": 40.0,
+            "area_sq_km": 105.0,
+            "population": 2200000,
+            "sci_score": 82.0,
+            "sci_rank": 5,
+            "numbeo_si": None,
+            "numbeo_ci": None,
+            "airport_code": "CDG",
+        },
+        {
+            "name": "Marseille",
+            "is_capital": False,
+            "description": "Second city",
+            "interesting_fact": "Fact 2",
+            "area_sq_mile": 92.0,
+            "area_sq_km": 240.0,
+            "population": 870000,
+            "sci_score": None,
+            "sci_rank": None,
+            "numbeo_si": None,
+            "numbeo_ci": None,
+            "airport_code": "MRS",
+        },
+    ]
+})
+
+_VALID_CITY_JSON = json.dumps({
+    "cities": [{
+        "name": "Test City",
+        "is_capital": True,
+        "description": "Test",
+        "interesting_fact": "Fact",
+        "area_sq_mile": 100.0,
+        "area_sq_km": 259.0,
+        "population": 1000000,
+        "sci_score": None,
+        "sci_rank": None,
+        "numbeo_si": None,
+        "numbeo_ci": None,
+        "airport_code": "TST",
+    }]
+})
+
+_EMPTY_JSON = "{}"
+_INVALID_JSON = "invalid json"
+
+# Canned responses shared across tests; the providers only read them
+_COUNTRY_RESPONSE = fake_response(_VALID_COUNTRY_JSON)
+_CITIES_RESPONSE = fake_response(_VALID_CITY_JSON)
+_EMPTY_RESPONSE = fake_response(_EMPTY_JSON)
+_INVALID_JSON_RESPONSE = fake_response(_INVALID_JSON)
+
+_ProviderFactory = Callable[[str], OpenAIProvider]
+
+
+@pytest.fixture
+def provider_with_response(mock_openai: MagicMock) -> _ProviderFactory:
+    """Return a factory for providers whose client replies with given content."""
+
+    def _make(content: str) -> OpenAIProvider:
+        mock_openai.chat.completions.create.return_value = fake_response(content)
+        return OpenAIProvider()
+
+    return _make
 
 
 class TestOpenAIProvider:
     """Tests for OpenAIProvider initialization."""
 
-    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"})
-    def test_init_with_env_var(self) -> None:
+    def test_init_with_env_var(self, mock_openai: MagicMock) -> None:
         """Test provider initializes with env var."""
-        with patch(
-            "process_structured_output.providers.openai_provider.OpenAI"
-        ):
-            provider = OpenAIProvider()
-            assert provider.api_key == "test-key"
+        provider = OpenAIProvider()
+        assert provider.api_key == "test-key"
 
-    def test_init_with_explicit_key(self) -> None:
+    def test_init_with_explicit_key(self, mock_openai: MagicMock) -> None:
         """Test provider initializes with explicit key."""
-        with patch(
-            "process_structured_output.providers.openai_provider.OpenAI"
-        ):
-            provider = OpenAIProvider(api_key="explicit-key")
-            assert provider.api_key == "explicit-key"
-
-    @patch("process_structured_output.providers.openai_provider.load_dotenv")
-    @patch.dict("os.environ", {}, clear=True)
-    def test_init_raises_without_key(self, mock_load_dotenv: MagicMock) -> None:
+        provider = OpenAIProvider(api_key="explicit-key")
+        assert provider.api_key == "explicit-key"
+
+    def test_init_raises_without_key(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test provider raises error without API key."""
+        monkeypatch.delenv("OPENAI_API_KEY")
+        monkeypatch.setattr(
+            "process_structured_output.providers.openai_provider.load_dotenv",
+            lambda: None,
+        )
         with pytest.raises(ValueError, match="OPENAI_API_KEY"):
             OpenAIProvider()
 
-    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"})
-    def test_get_model_identity_returns_hardcoded_values(self) -> None:
+    def test_get_model_identity_returns_hardcoded_values(
+        self, mock_openai: MagicMock
+    ) -> None:
         """Test get_model_identity returns hardcoded provider and model name."""
-        with patch(
-            "process_structured_output.providers.openai_provider.OpenAI"
-        ):
-            provider = OpenAIProvider()
-            identity = provider.get_model_identity()
-
-            # Hardcoded values - no API call made
-            assert identity.model_provider == "OpenAI"
-            assert identity.model_name == "gpt-4o"
-
-    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"})
-    def test_get_continent_info_parses_json(self) -> None:
-        """Test get_continent_info parses JSON response."""
-        mock_response = MagicMock()
-        mock_response.choices = [
-            MagicMock(
-                message=MagicMock(
-                    content=(
-                        '{"description": "Test", "area_sq_mile": 1000.0, '
-                        '"area_sq_km": 2590.0, "population": 1000000, '
-                        '"num_country": 5}'
-                    )
-                )
-            )
-        ]
+        provider = OpenAIProvider()
+        identity = provider.get_model_identity()
 
-        with patch(
-            "process_structured_output.providers.openai_provider.OpenAI"
-        ) as mock_openai:
-            mock_client = MagicMock()
-            mock_client.chat.completions.create.return_value = mock_response
-            mock_openai.return_value = mock_client
-
-            provider = OpenAIProvider()
-            info = provider.get_continent_info("TestContinent")
-
-            assert info.description == "Test"
-            assert info.area_sq_mile == 1000.0
-            assert info.population == 1000000
-
-    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"})
-    def test_get_continent_info_raises_on_invalid_json(self) -> None:
-        """Test get_continent_info raises on invalid JSON."""
-        mock_response = MagicMock()
-        mock_response.choices = [
-            MagicMock(message=MagicMock(content="not json"))
-        ]
+        # Hardcoded values - no API call made
+        assert identity.model_provider == "OpenAI"
+        assert identity.model_name == "gpt-4o"
 
-        with patch(
-            "process_structured_output.providers.openai_provider.OpenAI"
-        ) as mock_openai:
-            mock_client = MagicMock()
-            mock_client.chat.completions.create.return_value = mock_response
-            mock_openai.return_value = mock_client
+    def test_get_continent_info_parses_json(
+        self, provider_with_response: _ProviderFactory
+    ) -> None:
+        """Test get_continent_info parses JSON response."""
+        provider = provider_with_response(_VALID_CONTINENT_JSON)
+        info = provider.get_continent_info("TestContinent")
 
-            provider = OpenAIProvider()
-            with pytest.raises(ValueError, match="Failed to parse"):
-                provider.get_continent_info("TestContinent")
+        assert info.description == "Test"
+        assert info.area_sq_mile == 1000.0
+        assert info.population == 1000000
 
 
 class TestGetCountryInfo:
     """Tests for get_country_info method."""
 
-    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"})
-    def test_get_country_info_parses_json_response(self) -> None:
+    def test_get_country_info_parses_json_response(
+        self, provider_with_response: _ProviderFactory
+    ) -> None:
         """Test get_country_info parses JSON response."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = json.dumps({
-            "description": "Test country",
-            "interesting_fact": "A fun fact",
-            "area_sq_mile": 356669.0,
-            "area_sq_km": 923768.0,
-            "population": 67000000,
-            "ppp": 45000.0,
-            "life_expectancy": 82.0,
-            "travel_risk_level": "Level 1",
-            "global_peace_index_score": 1.9,
-            "global_peace_index_rank": 65,
-            "happiness_index_score": 6.5,
-            "happiness_index_rank": 21,
-            "gdp": 2800000000000.0,
-            "gdp_growth_rate": 2.5,
-            "inflation_rate": 5.0,
-            "unemployment_rate": 7.0,
-            "govt_debt": 110.0,
-            "credit_rating": "AA",
-            "poverty_rate": 15.0,
-            "gini_coefficient": 32.0,
-            "military_spending": 2.1,
-            "gdp_per_capita": 41800.0,
-        })
-
-        with patch(
-            "process_structured_output.providers.openai_provider.OpenAI"
-        ) as mock_openai:
-            mock_client = MagicMock()
-            mock_client.chat.completions.create.return_value = mock_response
-            mock_openai.return_value = mock_client
-
-            provider = OpenAIProvider()
-            info = provider.get_country_info("France")
-
-            assert info.description == "Test country"
-            assert info.population == 67000000
-            assert info.gdp == 2800000000000.0
-
-    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"})
-    def test_get_country_info_uses_json_mode(self) -> None:
+        provider = provider_with_response(_FRANCE_JSON)
+        info = provider.get_country_info("France")
+
+        assert info.description == "Test country"
+        assert info.population == 67000000
+        assert info.gdp == 2800000000000.0
+
+    def test_get_country_info_uses_json_mode(
+        self, mock_openai: MagicMock, provider_with_response: _ProviderFactory
+    ) -> None:
         """Test get_country_info uses JSON response format."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = json.dumps({
-            "description": "Test",
-            "interesting_fact": "Fact",
-            "area_sq_mile": 100.0,
-            "area_sq_km": 259.0,
-            "population": 1000000,
-            "ppp": 1000.0,
-            "life_expectancy": 75.0,
-            "travel_risk_level": "Low",
-            "global_peace_index_score": 1.5,
-            "global_peace_index_rank": 20,
-            "happiness_index_score": 6.5,
-            "happiness_index_rank": 25,
-            "gdp": 100000000.0,
-            "gdp_growth_rate": 2.0,
-            "inflation_rate": 2.0,
-            "unemployment_rate": 5.0,
-            "govt_debt": 50.0,
-            "credit_rating": "AA",
-            "poverty_rate": 10.0,
-            "gini_coefficient": 30.0,
-            "military_spending": 2.0,
-            "gdp_per_capita": 100.0,
-        })
-
-        with patch(
-            "process_structured_output.providers.openai_provider.OpenAI"
-        ) as mock_openai:
-            mock_client = MagicMock()
-            mock_client.chat.completions.create.return_value = mock_response
-            mock_openai.return_value = mock_client
-
-            provider = OpenAIProvider()
-            provider.get_country_info("Morocco")
-
-            # Verify JSON mode was used
-            call_kwargs = mock_client.chat.completions.create.call_args[1]
-            assert call_kwargs["response_format"] == {"type": "json_object"}
-
-    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"})
-    def test_get_country_info_raises_on_invalid_json(self) -> None:
-        """Test get_country_info raises on invalid JSON response."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "Not valid JSON at all"
-
-        with patch(
-            "process_structured_output.providers.openai_provider.OpenAI"
-        ) as mock_openai:
-            mock_client = MagicMock()
-            mock_client.chat.completions.create.return_value = mock_response
-            mock_openai.return_value = mock_client
-
-            provider = OpenAIProvider()
-            with pytest.raises(ValueError, match="Failed to parse"):
-                provider.get_country_info("France")
-
-    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"})
-    def test_get_country_info_raises_on_empty_json(self) -> None:
-        """Test get_country_info raises on empty JSON response."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "{}"
+        provider = provider_with_response(_VALID_COUNTRY_JSON)
+        provider.get_country_info("Morocco")
 
-        with patch(
-            "process_structured_output.providers.openai_provider.OpenAI"
-        ) as mock_openai:
-            mock_client = MagicMock()
-            mock_client.chat.completions.create.return_value = mock_response
-            mock_openai.return_value = mock_client
+        # Verify JSON mode was used
+        call_kwargs = mock_openai.chat.completions.create.call_args[1]
+        assert call_kwargs["response_format"] == {"type": "json_object"}
 
-            provider = OpenAIProvider()
-            with pytest.raises(ValueError, match="Empty JSON response"):
-                provider.get_country_info("France")
+    def test_get_country_info_reuses_parsed_response(
+        self, provider_with_response: _ProviderFactory
+    ) -> None:
+        """Test identical response content is parsed and validated once."""
+        provider = provider_with_response(_FRANCE_JSON)
+        first = provider.get_country_info("France")
+        second = provider.get_country_info("France")
+
+        assert second is first
+
+    def test_get_country_info_raises_on_empty_json(
+        self, provider_with_response: _ProviderFactory
+    ) -> None:
+        """Test get_country_info raises on empty JSON response."""
+        provider = provider_with_response(_EMPTY_JSON)
+        with pytest.raises(ValueError, match="Empty JSON response"):
+            provider.get_country_info("France")
 
 
 class TestGetCitiesInfo:
     """Tests for get_cities_info method."""
 
-    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"})
-    def test_get_cities_info_parses_json_response(self) -> None:
+    def test_get_cities_info_parses_json_response(
+        self, provider_with_response: _ProviderFactory
+    ) -> None:
         """Test get_cities_info parses JSON response."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = json.dumps({
-            "cities": [
-                {
-                    "name": "Paris",
-                    "is_capital": True,
-                    "description": "Capital of France",
-                    "interesting_fact": "City of lights",
-                    "area_sq_mile": 40.0,
-                    "area_sq_km": 105.0,
-                    "population": 2200000,
-                    "sci_score": 82.0,
-                    "sci_rank": 5,
-                    "numbeo_si": 48.0,
-                    "numbeo_ci": 52.0,
-                    "airport_code": "CDG",
-                }
-            ]
-        })
-
-        with patch(
-            "process_structured_output.providers.openai_provider.OpenAI"
-        ) as mock_openai:
-            mock_client = MagicMock()
-            mock_client.chat.completions.create.return_value = mock_response
-            mock_openai.return_value = mock_client
-
-            provider = OpenAIProvider()
-            cities = provider.get_cities_info("France")
-
-            assert len(cities) == 1
-            assert cities[0].name == "Paris"
-            assert cities[0].is_capital is True
-            assert cities[0].population == 2200000
-
-    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"})
-    def test_get_cities_info_handles_multiple_cities(self) -> None:
+        provider = provider_with_response(_PARIS_JSON)
+        cities = provider.get_cities_info("France")
+
+        assert len(cities) == 1
+        assert cities[0].name == "Paris"
+        assert cities[0].is_capital is True
+        assert cities[0].population == 2200000
+
+    def test_get_cities_info_handles_multiple_cities(
+        self, provider_with_response: _ProviderFactory
+    ) -> None:
         """Test get_cities_info handles multiple cities."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = json.dumps({
-            "cities": [
-                {
-                    "name": "Paris",
-                    "is_capital": True,
-                    "description": "Capital",
-                    "interesting_fact": "Fact 1",
-                    "area_sq_mile": 40.0,
-                    "area_sq_km": 105.0,
-                    "population": 2200000,
-                    "sci_score": 82.0,
-                    "sci_rank": 5,
-                    "numbeo_si": None,
-                    "numbeo_ci": None,
-                    "airport_code": "CDG",
-                },
-                {
-                    "name": "Marseille",
-                    "is_capital": False,
-                    "description": "Second city",
-                    "interesting_fact": "Fact 2",
-                    "area_sq_mile": 92.0,
-                    "area_sq_km": 240.0,
-                    "population": 870000,
-                    "sci_score": None,
-                    "sci_rank": None,
-                    "numbeo_si": None,
-                    "numbeo_ci": None,
-                    "airport_code": "MRS",
-                },
-            ]
-        })
-
-        with patch(
-            "process_structured_output.providers.openai_provider.OpenAI"
-        ) as mock_openai:
-            mock_client = MagicMock()
-            mock_client.chat.completions.create.return_value = mock_response
-            mock_openai.return_value = mock_client
-
-            provider = OpenAIProvider()
-            cities = provider.get_cities_info("France")
-
-            assert len(cities) == 2
-            assert cities[0].name == "Paris"
-            assert cities[1].name == "Marseille"
-
-    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"})
-    def test_get_cities_info_raises_on_invalid_json(self) -> None:
-        """Test get_cities_info raises on invalid JSON response."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "Not valid JSON"
-
-        with patch(
-            "process_structured_output.providers.openai_provider.OpenAI"
-        ) as mock_openai:
-            mock_client = MagicMock()
-            mock_client.chat.completions.create.return_value = mock_response
-            mock_openai.return_value = mock_client
-
-            provider = OpenAIProvider()
-            with pytest.raises(ValueError, match="Failed to parse"):
-                provider.get_cities_info("France")
+        provider = provider_with_response(_MULTI_CITY_JSON)
+        cities = provider.get_cities_info("France")
+
+        assert len(cities) == 2
+        assert cities[0].name == "Paris"
+        assert cities[1].name == "Marseille"
+
+    def test_get_cities_info_returns_independent_lists(
+        self, provider_with_response: _ProviderFactory
+    ) -> None:
+        """Test callers can modify results without affecting cached parses."""
+        provider = provider_with_response(_MULTI_CITY_JSON)
+        first = provider.get_cities_info("France")
+        first.clear()
+
+        assert len(provider.get_cities_info("France")) == 2
+
+
+class TestInvalidJson:
+    """Tests for invalid JSON handling across query methods."""
+
+    @pytest.mark.parametrize(
+        "method_name, arg",
+        [
+            ("get_continent_info", "TestContinent"),
+            ("get_country_info", "France"),
+            ("get_cities_info", "France"),
+        ],
+    )
+    def test_raises_on_invalid_json(
+        self, provider_with_response: _ProviderFactory, method_name: str, arg: str
+    ) -> None:
+        """Test each query method raises on an invalid JSON response."""
+        provider = provider_with_response(_INVALID_JSON)
+        with pytest.raises(ValueError, match="Failed to parse"):
+            getattr(provider, method_name)(arg)
+
+
+class TestJsonLoader:
+    """Tests for the orjson fast path and its json fallback."""
+
+    @pytest.fixture(params=["json", "orjson"])
+    def loader(
+        self, request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Route response parsing through each available JSON loader."""
+        module = pytest.importorskip(request.param)
+        monkeypatch.setattr(openai_provider, "_loads", module.loads)
+
+    @pytest.mark.usefixtures("loader")
+    def test_parses_country(self, provider_with_response: _ProviderFactory) -> None:
+        """Test a valid country response parses with either loader."""
+        provider = provider_with_response(_VALID_COUNTRY_JSON)
+        assert provider.get_country_info("France").population == 1000000
+
+    @pytest.mark.usefixtures("loader")
+    def test_invalid_json_maps_to_value_error(
+        self, provider_with_response: _ProviderFactory
+    ) -> None:
+        """Test either loader's decode error becomes the same ValueError."""
+        provider = provider_with_response(_INVALID_JSON)
+        with pytest.raises(ValueError, match="Failed to parse"):
+            provider.get_cities_info("France")
+
+    def test_falls_back_to_json_without_orjson(self) -> None:
+        """Test the module uses json.loads when orjson cannot be imported."""
+        code = (
+            "import json, sys\n"
+            "sys.modules['orjson'] = None\n"
+            "from process_structured_output.providers import openai_provider\n"
+            "assert openai_provider._loads is json.loads\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
 
 
 class TestRetryLogic:
     """Tests for retry logic in provider methods."""
 
-    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"})
-    @patch("process_structured_output.providers.openai_provider.time.sleep")
     def test_get_country_info_with_retry_retries_on_failure(
-        self, mock_sleep: MagicMock
+        self, mock_openai: MagicMock
     ) -> None:
         """Test retry logic retries on transient failures."""
-        valid_response = MagicMock()
-        valid_response.choices = [MagicMock()]
-        valid_response.choices[0].message.content = json.dumps({
-            "description": "Test",
-            "interesting_fact": "Fact",
-            "area_sq_mile": 100.0,
-            "area_sq_km": 259.0,
-            "population": 1000000,
-            "ppp": 1000.0,
-            "life_expectancy": 75.0,
-            "travel_risk_level": "Low",
-            "global_peace_index_score": 1.5,
-            "global_peace_index_rank": 20,
-            "happiness_index_score": 6.5,
-            "happiness_index_rank": 25,
-            "gdp": 100000000.0,
-            "gdp_growth_rate": 2.0,
-            "inflation_rate": 2.0,
-            "unemployment_rate": 5.0,
-            "govt_debt": 50.0,
-            "credit_rating": "AA",
-            "poverty_rate": 10.0,
-            "gini_coefficient": 30.0,
-            "military_spending": 2.0,
-            "gdp_per_capita": 100.0,
-        })
-
         # First call fails with empty content, second succeeds
-        fail_response = MagicMock()
-        fail_response.choices = [MagicMock()]
-        fail_response.choices[0].message.content = "{}"
-
-        with patch(
-            "process_structured_output.providers.openai_provider.OpenAI"
-        ) as mock_openai:
-            mock_client = MagicMock()
-            mock_client.chat.completions.create.side_effect = [
-                fail_response,
-                valid_response,
-            ]
-            mock_openai.return_value = mock_client
-
-            provider = OpenAIProvider()
-            info = provider.get_country_info_with_retry("Morocco")
-
-            assert info.description == "Test"
-            assert mock_sleep.call_count == 1
-            mock_sleep.assert_called_with(RETRY_DELAY)
-
-    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"})
-    @patch("process_structured_output.providers.openai_provider.time.sleep")
-    def test_retry_fails_after_max_retries(self, mock_sleep: MagicMock) -> None:
+        mock_openai.chat.completions.create.side_effect = [
+            _EMPTY_RESPONSE,
+            _COUNTRY_RESPONSE,
+        ]
+
+        mock_sleep = MagicMock()
+        provider = OpenAIProvider(sleep=mock_sleep, base_delay=0.0)
+        info = provider.get_country_info_with_retry("Morocco")
+
+        assert info.description == "Test"
+        assert mock_sleep.call_count == 1
+        mock_sleep.assert_called_with(0.0)
+
+    def test_retry_fails_after_max_retries(self, mock_openai: MagicMock) -> None:
         """Test retry gives up after max retries."""
-        fail_response = MagicMock()
-        fail_response.choices = [MagicMock()]
-        fail_response.choices[0].message.content = "{}"
-
-        with patch(
-            "process_structured_output.providers.openai_provider.OpenAI"
-        ) as mock_openai:
-            mock_client = MagicMock()
-            mock_client.chat.completions.create.return_value = fail_response
-            mock_openai.return_value = mock_client
-
-            provider = OpenAIProvider()
-            with pytest.raises(ValueError, match=f"Failed after {MAX_RETRIES}"):
-                provider.get_country_info_with_retry("Morocco")
-
-    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"})
-    @patch("process_structured_output.providers.openai_provider.time.sleep")
+        mock_openai.chat.completions.create.return_value = _EMPTY_RESPONSE
+
+        mock_sleep = MagicMock()
+        provider = OpenAIProvider(sleep=mock_sleep, base_delay=0.0)
+        with pytest.raises(ValueError, match=f"Failed after {MAX_RETRIES}"):
+            provider.get_country_info_with_retry("Morocco")
+        assert mock_sleep.call_count == MAX_RETRIES - 1
+
     def test_get_cities_info_with_retry_retries_on_failure(
-        self, mock_sleep: MagicMock
+        self, mock_openai: MagicMock
     ) -> None:
         """Test cities retry logic retries on transient failures."""
-        valid_response = MagicMock()
-        valid_response.choices = [MagicMock()]
-        valid_response.choices[0].message.content = json.dumps({
-            "cities": [{
-                "name": "Test City",
-                "is_capital": True,
-                "description": "Test",
-                "interesting_fact": "Fact",
-                "area_sq_mile": 100.0,
-                "area_sq_km": 259.0,
-                "population": 1000000,
-                "sci_score": None,
-                "sci_rank": None,
-                "numbeo_si": None,
-                "numbeo_ci": None,
-                "airport_code": "TST",
-            }]
-        })
-
         # First call fails, second succeeds
-        fail_response = MagicMock()
-        fail_response.choices = [MagicMock()]
-        fail_response.choices[0].message.content = "invalid json"
-
-        with patch(
-            "process_structured_output.providers.openai_provider.OpenAI"
-        ) as mock_openai:
-            mock_client = MagicMock()
-            mock_client.chat.completions.create.side_effect = [
-                fail_response,
-                valid_response,
-            ]
-            mock_openai.return_value = mock_client
+        mock_openai.chat.completions.create.side_effect = [
+            _INVALID_JSON_RESPONSE,
+            _CITIES_RESPONSE,
+        ]
 
-            provider = OpenAIProvider()
-            cities = provider.get_cities_info_with_retry("Test")
+        mock_sleep = MagicMock()
+        provider = OpenAIProvider(sleep=mock_sleep, base_delay=0.0)
+        cities = provider.get_cities_info_with_retry("Test")
 
-            assert len(cities) == 1
-            assert cities[0].name == "Test City"
-            assert mock_sleep.call_count == 1
+        assert len(cities) == 1
+        assert cities[0].name == "Test City"
+        assert mock_sleep.call_count == 1
 
 
 class TestConstants:
@@ -475,6 +405,6 @@ class TestConstants:
         """Test MAX_RETRIES has expected value."""
         assert MAX_RETRIES == 3
 
-    def test_retry_delay_value(self) -> None:
-        """Test RETRY_DELAY has expected value."""
-        assert RETRY_DELAY == 1.0
+    def test_retry_delay_values(self) -> None:
+        """Test RETRY_BASE_DELAY has expected value."""
+        assert RETRY_BASE_DELAY == 0.5
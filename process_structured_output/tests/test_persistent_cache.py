@@ -0,0 +1,96 @@
+"""Tests for persistent cache."""
+
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+
+from process_structured_output.providers.persistent_cache import PersistentCache
+
+
+class TestPersistentCache:
+    """Tests for PersistentCache."""
+
+    def test_get_returns_none_when_missing(self, tmp_path: Path) -> None:
+        """Test lookup of an unknown key misses."""
+        with PersistentCache(tmp_path / "cache.sqlite3") as cache:
+            assert cache.get("missing") is None
+
+    def test_value_survives_reopen(self, tmp_path: Path) -> None:
+        """Test stored values are visible to a new cache instance."""
+        path = tmp_path / "cache.sqlite3"
+        with PersistentCache(path) as cache:
+            cache.set("key", "value")
+
+        with PersistentCache(path) as cache:
+            assert cache.get("key") == "value"
+
+    def test_set_replaces_existing_value(self, tmp_path: Path) -> None:
+        """Test setting a key twice keeps the latest value."""
+        with PersistentCache(tmp_path / "cache.sqlite3") as cache:
+            cache.set("key", "old")
+            cache.set("key", "new")
+            assert cache.get("key") == "new"
+
+    def test_expired_entry_misses(self, tmp_path: Path) -> None:
+        """Test entries past their expiry are not returned."""
+        with PersistentCache(tmp_path / "cache.sqlite3", expire=-1.0) as cache:
+            cache.set("key", "value")
+            assert cache.get("key") is None
+
+    def test_clear_removes_entries(self, tmp_path: Path) -> None:
+        """Test clear empties the cache."""
+        with PersistentCache(tmp_path / "cache.sqlite3") as cache:
+            cache.set("key", "value")
+            cache.clear()
+            assert cache.get("key") is None
+
+    def test_open_purges_expired_entries(self, tmp_path: Path) -> None:
+        """Test expired rows are deleted from disk when the cache is opened."""
+        path = tmp_path / "cache.sqlite3"
+        with PersistentCache(path, expire=-1.0) as cache:
+            cache.set("old", "value")
+        with PersistentCache(path, expire=None) as cache:
+            cache.set("kept", "value")
+            rows = cache._conn.execute("SELECT key FROM cache").fetchall()
+        assert rows == [("kept",)]
+
+    def test_purge_expired_keeps_live_entries(self, tmp_path: Path) -> None:
+        """Test purge_expired deletes only entries past their expiry."""
+        with PersistentCache(tmp_path / "cache.sqlite3") as cache:
+            cache.set("live", "value")
+            cache.expire = -1.0
+            cache.set("stale", "value")
+            assert cache.purge_expired() == 1
+            assert cache.get("live") == "value"
+
+    def test_context_manager_closes_connection(self, tmp_path: Path) -> None:
+        """Test leaving a with block closes the database connection."""
+        with PersistentCache(tmp_path / "cache.sqlite3") as cache:
+            cache.set("key", "value")
+        with pytest.raises(sqlite3.ProgrammingError):
+            cache.get("key")
+
+    def test_shared_between_threads(self, tmp_path: Path) -> None:
+        """Test one cache instance can be used from several threads."""
+        errors: list[BaseException] = []
+
+        def worker(index: int) -> None:
+            try:
+                for n in range(20):
+                    key = f"{index}-{n}"
+                    cache.set(key, key)
+                    assert cache.get(key) == key
+            except BaseException as e:
+                errors.append(e)
+
+        with PersistentCache(tmp_path / "cache.sqlite3") as cache:
+            threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            count = cache._conn.execute("SELECT COUNT(*) FROM cache").fetchone()
+        assert errors == []
+        assert count == (80,)
@@ -0,0 +1,27 @@
+"""Tests for the shared retry backoff."""
+
+from process_structured_output.providers.retry import RETRY_MAX_DELAY, backoff_delay
+
+
+class TestBackoffDelay:
+    """Tests for backoff_delay."""
+
+    def test_doubles_per_attempt(self) -> None:
+        """Test backoff grows exponentially within the jitter bound."""
+        for attempt, expected in enumerate([0.5, 1.0, 2.0, 4.0]):
+            delay = backoff_delay(attempt, 0.5, 20.0)
+            assert expected <= delay <= expected * 1.1
+
+    def test_is_capped(self) -> None:
+        """Test backoff never exceeds max_delay plus jitter."""
+        delay = backoff_delay(10, 0.5, 20.0)
+        assert 20.0 <= delay <= 22.0
+
+    def test_default_cap(self) -> None:
+        """Test max_delay defaults to RETRY_MAX_DELAY."""
+        delay = backoff_delay(10, 1.0)
+        assert RETRY_MAX_DELAY <= delay <= RETRY_MAX_DELAY * 1.1
+
+    def test_max_delay_value(self) -> None:
+        """Test RETRY_MAX_DELAY has expected value."""
+        assert RETRY_MAX_DELAY == 20.0
@@ -0,0 +1,106 @@
+"""Tests for semantic cache."""
+
+import pytest
+
+from process_structured_output.providers.semantic_cache import (
+    DEFAULT_SIMILARITY_THRESHOLD,
+    SemanticCache,
+)
+
+
+def _letter_counts(text: str) -> list[float]:
+    """Embed text as case-insensitive letter counts."""
+    lowered = text.lower()
+    return [float(lowered.count(c)) for c in "abcdefghijklmnopqrstuvwxyz"]
+
+
+class TestSemanticCache:
+    """Tests for SemanticCache."""
+
+    def test_get_returns_none_when_empty(self) -> None:
+        """Test lookup on an empty cache misses."""
+        cache: SemanticCache[str] = SemanticCache(_letter_counts)
+        assert cache.get("Algeria") is None
+
+    def test_case_variants_share_slot(self) -> None:
+        """Test "Algeria" and "algeria" share a cache slot."""
+        cache: SemanticCache[str] = SemanticCache(_letter_counts)
+        cache.set("Algeria", "cached")
+        assert cache.get("algeria") == "cached"
+        assert len(cache) == 1
+
+    def test_dissimilar_query_misses(self) -> None:
+        """Test a different country does not hit the cache."""
+        cache: SemanticCache[str] = SemanticCache(_letter_counts)
+        cache.set("Algeria", "cached")
+        assert cache.get("Belgium") is None
+
+    def test_returns_most_similar_entry(self) -> None:
+        """Test lookup picks the closest stored query."""
+        cache: SemanticCache[str] = SemanticCache(_letter_counts, threshold=0.0)
+        cache.set("Belgium", "belgium")
+        cache.set("Algeria", "algeria")
+        assert cache.get("ALGERIA") == "algeria"
+
+    def test_reuses_embedding_between_get_and_set(self) -> None:
+        """Test a miss followed by set embeds the query only once."""
+        calls: list[str] = []
+
+        def embed(text: str) -> list[float]:
+            calls.append(text)
+            return _letter_counts(text)
+
+        cache: SemanticCache[str] = SemanticCache(embed)
+        cache.set("Belgium", "belgium")
+        calls.clear()
+        assert cache.get("Algeria") is None
+        cache.set("Algeria", "algeria")
+        assert calls == ["Algeria"]
+
+    def test_exact_repeat_skips_embedding(self) -> None:
+        """Test a repeat differing only in case and spacing is not embedded."""
+        calls: list[str] = []
+
+        def embed(text: str) -> list[float]:
+            calls.append(text)
+            return _letter_counts(text)
+
+        cache: SemanticCache[str] = SemanticCache(embed)
+        cache.set("Cote d'Ivoire", "cached")
+        calls.clear()
+        assert cache.get("  COTE  d'ivoire ") == "cached"
+        assert calls == []
+
+    def test_set_exact_repeat_replaces_value(self) -> None:
+        """Test setting an exact repeat overwrites the existing entry."""
+        cache: SemanticCache[str] = SemanticCache(_letter_counts)
+        cache.set("Algeria", "old")
+        cache.set("algeria", "new")
+        assert len(cache) == 1
+        assert cache.get("Algeria") == "new"
+
+    def test_near_duplicate_names_do_not_collide(self) -> None:
+        """Test "Niger" and "Nigeria" stay apart at the default threshold."""
+        cache: SemanticCache[str] = SemanticCache(_letter_counts)
+        cache.set("Niger", "niger")
+        assert cache.get("Nigeria") is None
+        cache.set("Nigeria", "nigeria")
+        assert cache.get("Niger") == "niger"
+        assert cache.get("Nigeria") == "nigeria"
+
+    def test_clear_removes_entries(self) -> None:
+        """Test clear empties the cache."""
+        cache: SemanticCache[str] = SemanticCache(_letter_counts)
+        cache.set("Algeria", "cached")
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.get("Algeria") is None
+
+    def test_invalid_threshold_raises(self) -> None:
+        """Test threshold outside 0-1 raises."""
+        with pytest.raises(ValueError, match="threshold"):
+            SemanticCache(_letter_counts, threshold=1.5)
+
+    def test_default_threshold_value(self) -> None:
+        """Test DEFAULT_SIMILARITY_THRESHOLD has expected value."""
+        assert DEFAULT_SIMILARITY_THRESHOLD == 0.95
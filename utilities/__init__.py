@@ -8,6 +8,8 @@ from utilities.color_palette import (
     NEUTRAL_COLOR,
     get_color_for_normalized_value,
     get_color_for_value,
+    get_colors_for_normalized_values,
+    get_colors_for_values,
 )
 
 __all__ = [
@@ -16,4 +18,6 @@ __all__ = [
     "BAD_COLOR",
     "get_color_for_value",
     "get_color_for_normalized_value",
+    "get_colors_for_normalized_values",
+    "get_colors_for_values",
 ]
@@ -0,0 +1,28 @@
+"""Concurrent warm-up of the utilities' CSV caches.
+
+Tools that use both countries_info and glossary can call warm_up() once at
+startup so both CSV files are read and parsed with overlapping file I/O
+instead of one after the other on first use.
+
+Example:
+    >>> from utilities._warmup import warm_up
+    >>> warm_up()
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from utilities import countries_info, glossary
+
+
+def warm_up() -> None:
+    """Load the countries and glossary data caches in parallel.
+
+    Raises:
+        FileNotFoundError: If either CSV file is missing.
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        countries_future = executor.submit(countries_info._get_data)
+        glossary_future = executor.submit(glossary._get_entries)
+    # Re-raise any parse error from the worker threads
+    countries_future.result()
+    glossary_future.result()
@@ -7,8 +7,16 @@ Example:
     >>> from utilities.color_palette import get_color_for_value
     >>> get_color_for_value(90, 0, 100, higher_is_better=True)
     '#33FF32'
+
+To color a whole column, pass it to get_colors_for_values rather than
+calling get_color_for_value per row (e.g., via pandas .apply): the range is
+validated once and the per-value loop skips the scalar call overhead.
+
+    df["color"] = get_colors_for_values(df["score"], 0, 100)
 """
 
+from collections.abc import Iterable
+from functools import lru_cache
 
 # Color constants
 GOOD_COLOR = "#00FF00"
@@ -20,6 +28,22 @@ GOOD_RGB: tuple[int, int, int] = (0, 255, 0)
 NEUTRAL_RGB: tuple[int, int, int] = (255, 255, 250)
 BAD_RGB: tuple[int, int, int] = (255, 0, 0)
 
+# Interpolation endpoints indexed by [higher_is_better][value > median_val];
+# callers coerce both with bool() so numpy bools and None index correctly
+_Zone = tuple[tuple[int, int, int], tuple[int, int, int]]
+_ZONE_ENDPOINTS: tuple[tuple[_Zone, _Zone], tuple[_Zone, _Zone]] = (
+    # Lower is better: GOOD -> NEUTRAL below the median, NEUTRAL -> BAD above
+    ((GOOD_RGB, NEUTRAL_RGB), (NEUTRAL_RGB, BAD_RGB)),
+    # Higher is better: BAD -> NEUTRAL below the median, NEUTRAL -> GOOD above
+    ((BAD_RGB, NEUTRAL_RGB), (NEUTRAL_RGB, GOOD_RGB)),
+)
+
+# Characters accepted in a hex color string
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+# Two-digit hex strings for each channel value
+_HEX_LUT: tuple[str, ...] = tuple(format(i, "02X") for i in range(256))
+
 
 def _interpolate_rgb(
     color1: tuple[int, int, int],
@@ -52,7 +76,8 @@ def _rgb_to_hex(rgb: tuple[int, int, int]) -> str:
     Returns:
         Hex color string (e.g., "#FF0000").
     """
-    return f"#{rgb[0]:02X}{rgb[1]:02X}{rgb[2]:02X}"
+    # A single f-string builds the result in one allocation
+    return f"#{_HEX_LUT[rgb[0]]}{_HEX_LUT[rgb[1]]}{_HEX_LUT[rgb[2]]}"
 
 
 def _hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
@@ -63,15 +88,89 @@ def _hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
 
     Returns:
         RGB tuple with values 0-255.
+
+    Raises:
+        ValueError: If hex_color is not exactly six hex digits.
+    """
+    digits = hex_color.lstrip("#")
+    # int(..., 16) alone would also take "0x", "_" and whitespace
+    if len(digits) != 6 or not _HEX_DIGITS.issuperset(digits):
+        raise ValueError(f"Invalid hex color: {hex_color!r}")
+    # One base-16 parse of the whole color, then split the channels
+    rgb = int(digits, 16)
+    return (rgb >> 16) & 0xFF, (rgb >> 8) & 0xFF, rgb & 0xFF
+
+
+def _resolve_median(min_val: float, max_val: float, median_val: float | None) -> float:
+    """Validate a value range and return its median (midpoint if None).
+
+    Raises:
+        ValueError: If min_val >= max_val or median_val outside range.
     """
-    hex_color = hex_color.lstrip("#")
+    if min_val >= max_val:
+        raise ValueError(
+            f"min_val ({min_val}) must be less than max_val ({max_val})"
+        )
+
+    # Default median to midpoint if not specified
+    if median_val is None:
+        median_val = (min_val + max_val) / 2
+
+    # Validate median is within range
+    if not (min_val <= median_val <= max_val):
+        raise ValueError(
+            f"median_val ({median_val}) must be between min_val ({min_val}) "
+            f"and max_val ({max_val})"
+        )
+    return median_val
+
+
+def _color_in_range(
+    value: float,
+    min_val: float,
+    max_val: float,
+    higher_is_better: bool,
+    median_val: float,
+) -> str:
+    """Map a value to a hex color for an already validated range."""
+    # Clamp value to range
+    value = max(min_val, min(max_val, value))
+
+    # Pick the zone's endpoints by table lookup rather than nested branches
+    upper = bool(value > median_val)
+    start, end = _ZONE_ENDPOINTS[bool(higher_is_better)][upper]
+    if upper:
+        # value > median_val after clamping implies max_val > median_val
+        t = (value - median_val) / (max_val - median_val)
+    elif median_val == min_val:
+        t = 0.0
+    else:
+        t = (value - min_val) / (median_val - min_val)
+
+    # Same arithmetic as _interpolate_rgb + _rgb_to_hex, inlined to skip the
+    # intermediate tuple and two function calls per color
     return (
-        int(hex_color[0:2], 16),
-        int(hex_color[2:4], 16),
-        int(hex_color[4:6], 16),
+        f"#{_HEX_LUT[int(start[0] + (end[0] - start[0]) * t)]}"
+        f"{_HEX_LUT[int(start[1] + (end[1] - start[1]) * t)]}"
+        f"{_HEX_LUT[int(start[2] + (end[2] - start[2]) * t)]}"
     )
 
 
+# Results are cached per argument tuple; the color constants never change,
+# so a cached color stays correct for the life of the process
+@lru_cache(maxsize=4096)
+def _compute_color(
+    value: float,
+    min_val: float,
+    max_val: float,
+    higher_is_better: bool,
+    median_val: float | None,
+) -> str:
+    """Compute the hex color for get_color_for_value (see its docstring)."""
+    median_val = _resolve_median(min_val, max_val, median_val)
+    return _color_in_range(value, min_val, max_val, higher_is_better, median_val)
+
+
 def get_color_for_value(
     value: float,
     min_val: float = 0.0,
@@ -114,59 +213,92 @@ def get_color_for_value(
         >>> get_color_for_value(28, 0, 100, median_val=70)
         '#FF6664'
     """
-    if min_val >= max_val:
-        raise ValueError(
-            f"min_val ({min_val}) must be less than max_val ({max_val})"
-        )
+    if max_val == 100.0 and min_val == 0.0 and median_val is None and higher_is_better:
+        color = _DEFAULT_SCALE_LUT.get(value)
+        if color is not None:
+            return color
+    return _compute_color(value, min_val, max_val, higher_is_better, median_val)
 
-    # Default median to midpoint if not specified
-    if median_val is None:
-        median_val = (min_val + max_val) / 2
 
-    # Validate median is within range
-    if not (min_val <= median_val <= max_val):
-        raise ValueError(
-            f"median_val ({median_val}) must be between min_val ({min_val}) "
-            f"and max_val ({max_val})"
-        )
+# Precomputed colors for every multiple of 0.1 on the default 0-100 scale.
+# Keys are the exact floats i / 10, so a lookup hits only for those values
+# (ints included) and returns exactly what _color_in_range would compute.
+_DEFAULT_SCALE_LUT: dict[float, str] = {
+    i / 10: _color_in_range(i / 10, 0.0, 100.0, True, 50.0) for i in range(1001)
+}
 
-    # Clamp value to range
-    value = max(min_val, min(max_val, value))
 
-    # Determine which zone the value is in and interpolate
-    if higher_is_better:
-        if value <= median_val:
-            # Bad zone: min_val → median_val maps to BAD → NEUTRAL
-            if median_val == min_val:
-                t = 0.0
-            else:
-                t = (value - min_val) / (median_val - min_val)
-            rgb = _interpolate_rgb(BAD_RGB, NEUTRAL_RGB, t)
-        else:
-            # Good zone: median_val → max_val maps to NEUTRAL → GOOD
-            if max_val == median_val:
-                t = 1.0
-            else:
-                t = (value - median_val) / (max_val - median_val)
-            rgb = _interpolate_rgb(NEUTRAL_RGB, GOOD_RGB, t)
-    else:
-        # Lower is better
-        if value <= median_val:
-            # Good zone: min_val → median_val maps to GOOD → NEUTRAL
-            if median_val == min_val:
-                t = 0.0
-            else:
-                t = (value - min_val) / (median_val - min_val)
-            rgb = _interpolate_rgb(GOOD_RGB, NEUTRAL_RGB, t)
-        else:
-            # Bad zone: median_val → max_val maps to NEUTRAL → BAD
-            if max_val == median_val:
-                t = 1.0
-            else:
-                t = (value - median_val) / (max_val - median_val)
-            rgb = _interpolate_rgb(NEUTRAL_RGB, BAD_RGB, t)
+def get_colors_for_values(
+    values: Iterable[float],
+    min_val: float = 0.0,
+    max_val: float = 100.0,
+    higher_is_better: bool = True,
+    median_val: float | None = None,
+) -> list[str]:
+    """Get hex colors for many values sharing one bad-neutral-good scale.
+
+    Batch form of get_color_for_value for callers coloring a whole column.
+    The range is validated once and repeated values are converted once.
+
+    Args:
+        values: Values to map to colors.
+        min_val: Minimum value of the range (default 0.0).
+        max_val: Maximum value of the range (default 100.0).
+        higher_is_better: If True, max_val maps to good (green).
+        median_val: Optional median value for asymmetric gradients.
 
-    return _rgb_to_hex(rgb)
+    Returns:
+        Hex color strings in the same order as the input.
+
+    Raises:
+        ValueError: If min_val >= max_val or median_val outside range.
+
+    Example:
+        >>> get_colors_for_values([28, 94, 28], median_val=70)
+        ['#FF6664', '#33FF32', '#FF6664']
+    """
+    median = _resolve_median(min_val, max_val, median_val)
+    (low_start, low_end), (high_start, high_end) = _ZONE_ENDPOINTS[
+        bool(higher_is_better)
+    ]
+    # Zone endpoints and channel deltas are fixed for the whole batch, so the
+    # loop below only clamps, picks a zone and interpolates (same arithmetic
+    # as _color_in_range, without a function call per value)
+    low_r, low_g, low_b = low_start
+    low_dr = low_end[0] - low_r
+    low_dg = low_end[1] - low_g
+    low_db = low_end[2] - low_b
+    high_r, high_g, high_b = high_start
+    high_dr = high_end[0] - high_r
+    high_dg = high_end[1] - high_g
+    high_db = high_end[2] - high_b
+    low_span = median - min_val
+    high_span = max_val - median
+    hex_lut = _HEX_LUT
+
+    seen: dict[float, str] = {}
+    colors: list[str] = []
+    for value in values:
+        color = seen.get(value)
+        if color is None:
+            clamped = max(min_val, min(max_val, value))
+            if clamped <= median:
+                t = (clamped - min_val) / low_span if low_span else 0.0
+                color = (
+                    f"#{hex_lut[int(low_r + low_dr * t)]}"
+                    f"{hex_lut[int(low_g + low_dg * t)]}"
+                    f"{hex_lut[int(low_b + low_db * t)]}"
+                )
+            else:
+                t = (clamped - median) / high_span if high_span else 1.0
+                color = (
+                    f"#{hex_lut[int(high_r + high_dr * t)]}"
+                    f"{hex_lut[int(high_g + high_dg * t)]}"
+                    f"{hex_lut[int(high_b + high_db * t)]}"
+                )
+            seen[value] = color
+        colors.append(color)
+    return colors
 
 
 def get_color_for_normalized_value(normalized: float) -> str:
@@ -189,17 +321,70 @@ def get_color_for_normalized_value(normalized: float) -> str:
         >>> get_color_for_normalized_value(1.0)
         '#00FF00'
     """
+    color = _NORM_LUT.get(normalized)
+    if color is None:
+        color = _compute_normalized_color(normalized)
+    return color
+
+
+@lru_cache(maxsize=4096)
+def _compute_normalized_color(normalized: float) -> str:
+    """Compute the hex color for get_color_for_normalized_value."""
     # Clamp to valid range
     normalized = max(0.0, min(1.0, normalized))
 
+    # Interpolation inlined with the constant channel deltas of
+    # BAD -> NEUTRAL and NEUTRAL -> GOOD (same results as _interpolate_rgb)
     if normalized < 0.5:
         t = normalized * 2
-        rgb = _interpolate_rgb(BAD_RGB, NEUTRAL_RGB, t)
-    else:
-        t = (normalized - 0.5) * 2
-        rgb = _interpolate_rgb(NEUTRAL_RGB, GOOD_RGB, t)
+        return f"#FF{_HEX_LUT[int(255 * t)]}{_HEX_LUT[int(250 * t)]}"
+    t = (normalized - 0.5) * 2
+    return f"#{_HEX_LUT[int(255 - 255 * t)]}FF{_HEX_LUT[int(250 - 250 * t)]}"
+
+
+# Precomputed colors for every multiple of 0.001 in [0, 1]. Keys are the exact
+# floats i / 1000, so a lookup hits only for those values and the result is
+# identical to computing it; anything else falls back to the computation.
+_NORM_LUT: dict[float, str] = {
+    i / 1000: _compute_normalized_color.__wrapped__(i / 1000) for i in range(1001)
+}
+
+
+def clear_cache() -> None:
+    """Discard all memoized colors.
 
-    return _rgb_to_hex(rgb)
+    Example:
+        >>> from utilities.color_palette import clear_cache
+        >>> clear_cache()
+    """
+    _compute_color.cache_clear()
+    _compute_normalized_color.cache_clear()
+
+
+def get_colors_for_normalized_values(values: Iterable[float]) -> list[str]:
+    """Get hex colors for many pre-normalized values (0.0 to 1.0).
+
+    Batch form of get_color_for_normalized_value for callers coloring a
+    whole column. Repeated values are converted once and reused.
+
+    Args:
+        values: Values between 0.0 (bad) and 1.0 (good).
+
+    Returns:
+        Hex color strings in the same order as the input.
+
+    Example:
+        >>> get_colors_for_normalized_values([0.0, 0.5, 1.0, 0.0])
+        ['#FF0000', '#FFFFFA', '#00FF00', '#FF0000']
+    """
+    seen: dict[float, str] = {}
+    colors: list[str] = []
+    for normalized in values:
+        color = seen.get(normalized)
+        if color is None:
+            color = seen[normalized] = get_color_for_normalized_value(normalized)
+        colors.append(color)
+    return colors
 
 
 if __name__ == "__main__":
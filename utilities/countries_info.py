@@ -12,11 +12,16 @@ Example:
 """
 
 import csv
-from dataclasses import dataclass, field
+import io
+import os
+import pickle
+import threading
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from pathlib import Path
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CountryInfo:
     """Information about a country's LLM assignment."""
 
@@ -25,20 +30,39 @@ class CountryInfo:
     llm: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CountriesData:
-    """Parsed countries data from CSV."""
+    """Parsed countries data from CSV.
 
-    continents: list[str] = field(default_factory=list)
-    llms: list[str] = field(default_factory=list)
-    countries: list[str] = field(default_factory=list)
-    continent_countries: dict[str, list[str]] = field(default_factory=dict)
-    llm_countries: dict[str, list[str]] = field(default_factory=dict)
+    Name collections are stored as tuples so the cached data cannot be
+    mutated through a returned reference.
+    """
+
+    continents: tuple[str, ...] = ()
+    llms: tuple[str, ...] = ()
+    countries: tuple[str, ...] = ()
+    continent_countries: dict[str, tuple[str, ...]] = field(default_factory=dict)
+    llm_countries: dict[str, tuple[str, ...]] = field(default_factory=dict)
     country_info_map: dict[str, CountryInfo] = field(default_factory=dict)
+    # Lowercase name -> canonical name, for O(1) case-insensitive lookups
+    continent_lower: dict[str, str] = field(default_factory=dict)
+    llm_lower: dict[str, str] = field(default_factory=dict)
+    # (continent, llm) -> sorted countries in both
+    intersections: dict[tuple[str, str], tuple[str, ...]] = field(default_factory=dict)
 
 
 # Module-level cache for parsed data
 _cached_data: CountriesData | None = None
+# Serializes reload_data(); readers never take it
+_reload_lock = threading.Lock()
+
+# Set to any non-empty value to bypass the on-disk pickle cache
+CACHE_DISABLE_ENV = "COUNTRIES_CACHE_DISABLE"
+
+# Version of the pickle sidecar layout. Bump it whenever CountryInfo or
+# CountriesData change in a way that alters what gets pickled.
+# 2: CountryInfo became frozen
+_CACHE_FORMAT = 2
 
 
 def _get_csv_path() -> Path:
@@ -47,88 +71,227 @@ def _get_csv_path() -> Path:
     return Path(__file__).parent.parent / "countries" / "countries.csv"
 
 
+def _read_rows(csv_path: Path) -> list[list[str]]:
+    """Read the CSV into rows of cells.
+
+    The file is a grid of unquoted names, so plain line splitting is used.
+    csv.reader is only needed if a cell is quoted (e.g. contains a comma).
+    """
+    # utf-8-sig strips the BOM
+    try:
+        text = csv_path.read_text(encoding="utf-8-sig")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Countries CSV not found: {csv_path}") from None
+    if '"' in text:
+        return list(csv.reader(io.StringIO(text)))
+    return [line.split(",") for line in text.splitlines()]
+
+
 def _parse_csv() -> CountriesData:
     """Parse the countries CSV file and return structured data."""
     csv_path = _get_csv_path()
 
-    if not csv_path.exists():
-        raise FileNotFoundError(f"Countries CSV not found: {csv_path}")
-
     data = CountriesData()
-    continent_set: set[str] = set()
-    country_set: set[str] = set()
-
-    # Read CSV with BOM handling
-    with open(csv_path, encoding="utf-8-sig", newline="") as f:
-        reader = csv.reader(f)
-
-        # Parse header row to get LLM names
-        header = next(reader)
-        data.llms = [llm.strip() for llm in header[2:] if llm.strip()]
-
-        # Initialize llm_countries dict
-        for llm in data.llms:
-            data.llm_countries[llm] = []
-
-        # Parse data rows
-        for row in reader:
-            if not row or not row[0].strip():
-                continue
-
-            continent = row[0].strip()
-            continent_set.add(continent)
-
-            # Initialize continent in dict if needed
-            if continent not in data.continent_countries:
-                data.continent_countries[continent] = []
-
-            # Process each LLM column (columns 2-9)
-            for i, llm in enumerate(data.llms):
-                col_idx = i + 2  # LLM columns start at index 2
-                if col_idx < len(row) and row[col_idx].strip():
-                    country = row[col_idx].strip()
-                    country_set.add(country)
-
-                    # Add to continent mapping
-                    if country not in data.continent_countries[continent]:
-                        data.continent_countries[continent].append(country)
-
-                    # Add to LLM mapping
-                    if country not in data.llm_countries[llm]:
-                        data.llm_countries[llm].append(country)
-
-                    # Add to country info map
-                    data.country_info_map[country.lower()] = CountryInfo(
+    # Set-backed accumulators used only for O(1) dedup while building lists
+    continent_sets: dict[str, set[str]] = {}
+    llm_sets: dict[str, set[str]] = {}
+    continent_lists: dict[str, list[str]] = {}
+    llm_lists: dict[str, list[str]] = {}
+
+    rows = _read_rows(csv_path)
+
+    # Parse header row to get LLM names
+    header = rows[0] if rows else []
+    data.llms = tuple(llm.strip() for llm in header[2:] if llm.strip())
+
+    # Initialize LLM accumulators
+    for llm in data.llms:
+        llm_lists[llm] = []
+        data.llm_lower[llm.lower()] = llm
+        llm_sets[llm] = set()
+
+    # Parse data rows
+    for row in rows[1:]:
+        if not row or not row[0].strip():
+            continue
+
+        continent = row[0].strip()
+
+        # Look up the continent's accumulators once per row
+        seen = continent_sets.setdefault(continent, set())
+        members = continent_lists.setdefault(continent, [])
+        data.continent_lower.setdefault(continent.lower(), continent)
+
+        # Process each LLM column (columns 2-9)
+        for i, llm in enumerate(data.llms):
+            col_idx = i + 2  # LLM columns start at index 2
+            country = row[col_idx].strip() if col_idx < len(row) else ""
+            if country:
+                # First occurrence of a country decides its continent and LLM
+                key = country.lower()
+                if key not in data.country_info_map:
+                    data.country_info_map[key] = CountryInfo(
                         country=country,
                         continent=continent,
                         llm=llm,
                     )
 
-    # Sort results
-    data.continents = sorted(continent_set)
-    data.countries = sorted(country_set)
+                # Add to continent mapping
+                if country not in seen:
+                    seen.add(country)
+                    members.append(country)
+
+                # Add to LLM mapping
+                llm_seen = llm_sets[llm]
+                if country not in llm_seen:
+                    llm_seen.add(country)
+                    llm_lists[llm].append(country)
+
+    # Freeze and sort results
+    data.continent_countries = {k: tuple(v) for k, v in continent_lists.items()}
+    data.llm_countries = {k: tuple(v) for k, v in llm_lists.items()}
+    # The accumulator dicts already hold each name once in CSV order, so
+    # sorting their keys needs no separate dedup set
+    data.continents = tuple(sorted(continent_lists))
+    data.countries = tuple(
+        sorted(info.country for info in data.country_info_map.values())
+    )
+
+    # Pre-bake every continent/LLM combination so filters are a dict lookup
+    llm_member_sets = {llm: set(countries) for llm, countries in llm_lists.items()}
+    for continent, countries in continent_lists.items():
+        for llm, llm_members in llm_member_sets.items():
+            data.intersections[(continent, llm)] = tuple(
+                sorted(llm_members.intersection(countries))
+            )
+
+    return data
+
+
+def _get_cache_path(csv_path: Path) -> Path:
+    """Get path to the pickle sidecar holding parsed data for a CSV."""
+    return csv_path.with_name(csv_path.name + ".cache.pkl")
 
+
+def _cache_key() -> tuple[object, ...]:
+    """Identify the pickled layout: format version plus each class's shape.
+
+    A sidecar written for another key is re-parsed rather than unpickled into
+    classes whose fields or frozen/slots settings no longer match.
+    """
+    key: list[object] = [_CACHE_FORMAT]
+    for cls in (CountryInfo, CountriesData):
+        params = getattr(cls, "__dataclass_params__")
+        key.append(
+            (
+                cls.__qualname__,
+                tuple(f.name for f in fields(cls)),
+                params.frozen,
+                "__slots__" in cls.__dict__,
+            )
+        )
+    return tuple(key)
+
+
+def _load_or_parse() -> CountriesData:
+    """Load parsed data from the pickle sidecar, re-parsing if it is stale.
+
+    The sidecar stores the layout key from _cache_key() and the CSV's mtime
+    alongside the data, so an edited CSV or a changed data layout is always
+    re-parsed. Unreadable or unwritable sidecars are ignored.
+    """
+    csv_path = _get_csv_path()
+    if os.environ.get(CACHE_DISABLE_ENV):
+        return _parse_csv()
+
+    try:
+        mtime = csv_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        # Let the parser raise its descriptive error
+        return _parse_csv()
+    key = _cache_key()
+    cache_path = _get_cache_path(csv_path)
+    try:
+        with open(cache_path, "rb") as f:
+            cached_key, cached_mtime, cached = pickle.load(f)
+        if (
+            cached_key == key
+            and cached_mtime == mtime
+            and isinstance(cached, CountriesData)
+        ):
+            return cached
+    except (
+        OSError,
+        EOFError,
+        pickle.UnpicklingError,
+        AttributeError,
+        TypeError,
+        ValueError,
+    ):
+        pass
+
+    data = _parse_csv()
+    # Write to a temp file and rename so concurrent readers never see a partial file
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump((key, mtime, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
     return data
 
 
 def _get_data() -> CountriesData:
-    """Get cached parsed data, parsing if necessary."""
+    """Get cached parsed data, loading or parsing if necessary."""
     global _cached_data
     if _cached_data is None:
-        _cached_data = _parse_csv()
+        _cached_data = _load_or_parse()
     return _cached_data
 
 
+# The lookup helpers are keyed on the caller's spelling so a cache hit skips
+# case folding entirely; the name is lowercased only on a miss.
+@lru_cache(maxsize=256)
+def _countries_by_continent_name(name: str) -> tuple[str, ...] | None:
+    """Return countries for a continent name in any case, or None if unknown."""
+    data = _get_data()
+    continent = data.continent_lower.get(name.lower())
+    return None if continent is None else data.continent_countries[continent]
+
+
+@lru_cache(maxsize=256)
+def _countries_by_llm_name(name: str) -> tuple[str, ...] | None:
+    """Return countries for an LLM name in any case, or None if unknown."""
+    data = _get_data()
+    llm = data.llm_lower.get(name.lower())
+    return None if llm is None else data.llm_countries[llm]
+
+
+@lru_cache(maxsize=256)
+def _country_info_by_name(name: str) -> CountryInfo | None:
+    """Return info for a country name in any case, or None if unknown."""
+    return _get_data().country_info_map.get(name.lower())
+
+
 def reload_data() -> None:
-    """Force reload of countries data from CSV.
+    """Force reload of countries data from CSV, discarding the pickle cache.
 
     Example:
         >>> from utilities.countries_info import reload_data
         >>> reload_data()  # Force fresh read from CSV
     """
     global _cached_data
-    _cached_data = None
-    _get_data()
+    with _reload_lock:
+        _cached_data = None
+        try:
+            _get_cache_path(_get_csv_path()).unlink(missing_ok=True)
+        except OSError:
+            pass
+        _countries_by_continent_name.cache_clear()
+        _countries_by_llm_name.cache_clear()
+        _country_info_by_name.cache_clear()
+        _get_data()
 
 
 def get_continents() -> list[str]:
@@ -145,7 +308,7 @@ def get_continents() -> list[str]:
         >>> print(len(continents))
         7
     """
-    return _get_data().continents.copy()
+    return list(_get_data().continents)
 
 
 def get_llms() -> list[str]:
@@ -162,7 +325,7 @@ def get_llms() -> list[str]:
         >>> print(len(llms))
         8
     """
-    return _get_data().llms.copy()
+    return list(_get_data().llms)
 
 
 def get_all_countries() -> list[str]:
@@ -177,7 +340,7 @@ def get_all_countries() -> list[str]:
         >>> print("Nigeria" in countries)
         True
     """
-    return _get_data().countries.copy()
+    return list(_get_data().countries)
 
 
 def get_countries_by_continent(continent_name: str) -> list[str]:
@@ -200,14 +363,12 @@ def get_countries_by_continent(continent_name: str) -> list[str]:
         >>> print(len(african_countries))
         16
     """
-    data = _get_data()
-
     # Case-insensitive lookup
-    for continent in data.continents:
-        if continent.lower() == continent_name.lower():
-            return data.continent_countries[continent].copy()
+    countries = _countries_by_continent_name(continent_name)
+    if countries is not None:
+        return list(countries)
 
-    valid = ", ".join(data.continents)
+    valid = ", ".join(_get_data().continents)
     raise ValueError(f"Continent '{continent_name}' not found. Valid: {valid}")
 
 
@@ -229,17 +390,78 @@ def get_countries_by_llm(llm_name: str) -> list[str]:
         >>> print("Morocco" in openai_countries)
         True
     """
-    data = _get_data()
-
     # Case-insensitive lookup
-    for llm in data.llms:
-        if llm.lower() == llm_name.lower():
-            return data.llm_countries[llm].copy()
+    countries = _countries_by_llm_name(llm_name)
+    if countries is not None:
+        return list(countries)
 
-    valid = ", ".join(data.llms)
+    valid = ", ".join(_get_data().llms)
     raise ValueError(f"LLM '{llm_name}' not found. Valid: {valid}")
 
 
+def get_countries_by_continent_and_llm(continent_name: str, llm_name: str) -> list[str]:
+    """Return countries in a continent that are assigned to an LLM provider.
+
+    Args:
+        continent_name: Name of the continent (case-insensitive).
+        llm_name: Name of the LLM provider (case-insensitive).
+
+    Returns:
+        Sorted list of country names in both the continent and the LLM.
+
+    Raises:
+        ValueError: If continent_name or llm_name is not found.
+
+    Example:
+        >>> from utilities.countries_info import get_countries_by_continent_and_llm
+        >>> get_countries_by_continent_and_llm("Africa", "OpenAI")
+        ['Cameroon', 'Morocco']
+    """
+    data = _get_data()
+
+    continent = data.continent_lower.get(continent_name.lower())
+    if continent is None:
+        valid = ", ".join(data.continents)
+        raise ValueError(f"Continent '{continent_name}' not found. Valid: {valid}")
+
+    llm = data.llm_lower.get(llm_name.lower())
+    if llm is None:
+        valid = ", ".join(data.llms)
+        raise ValueError(f"LLM '{llm_name}' not found. Valid: {valid}")
+
+    return list(data.intersections[(continent, llm)])
+
+
+def get_continent_counts() -> dict[str, int]:
+    """Return the number of countries in each continent.
+
+    Returns:
+        Mapping of continent name to country count, in sorted continent order.
+
+    Example:
+        >>> from utilities.countries_info import get_continent_counts
+        >>> get_continent_counts()["Africa"]
+        16
+    """
+    data = _get_data()
+    return {c: len(data.continent_countries[c]) for c in data.continents}
+
+
+def get_llm_counts() -> dict[str, int]:
+    """Return the number of countries assigned to each LLM provider.
+
+    Returns:
+        Mapping of LLM provider name to country count, in column order.
+
+    Example:
+        >>> from utilities.countries_info import get_llm_counts
+        >>> len(get_llm_counts())
+        8
+    """
+    data = _get_data()
+    return {llm: len(data.llm_countries[llm]) for llm in data.llms}
+
+
 def get_country_info(country_name: str) -> CountryInfo:
     """Return the continent and LLM for a specific country.
 
@@ -260,11 +482,9 @@ def get_country_info(country_name: str) -> CountryInfo:
         >>> print(info.llm)
         AI21
     """
-    data = _get_data()
-    key = country_name.lower()
-
-    if key in data.country_info_map:
-        return data.country_info_map[key]
+    info = _country_info_by_name(country_name)
+    if info is not None:
+        return info
 
     raise ValueError(f"Country '{country_name}' not found in countries data.")
 
@@ -308,10 +528,8 @@ Examples:
     if args.continent or args.llm:
         try:
             if args.continent and args.llm:
-                # Both filters: intersection
-                continent_countries = set(get_countries_by_continent(args.continent))
-                llm_countries = set(get_countries_by_llm(args.llm))
-                countries = list(continent_countries & llm_countries)
+                # Both filters: pre-computed intersection
+                countries = get_countries_by_continent_and_llm(args.continent, args.llm)
                 label = f"{args.continent} for {args.llm}"
                 print(f"Countries in {label} ({len(countries)}):")
             elif args.continent:
@@ -344,13 +562,11 @@ Examples:
     print("=== Countries Info Utility ===\n")
 
     print("Continents:")
-    for continent in get_continents():
-        count = len(get_countries_by_continent(continent))
+    for continent, count in get_continent_counts().items():
         print(f"  - {continent}: {count} countries")
 
     print("\nLLM Providers:")
-    for llm in get_llms():
-        count = len(get_countries_by_llm(llm))
+    for llm, count in get_llm_counts().items():
         print(f"  - {llm}: {count} countries")
 
-    print(f"\nTotal Countries: {len(get_all_countries())}")
+    print(f"\nTotal Countries: {len(_get_data().countries)}")
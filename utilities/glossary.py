@@ -11,15 +11,36 @@ Example:
 """
 
 import csv
+import io
 import os
+import threading
+from collections.abc import Sequence
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-
-import psycopg2
-from dotenv import load_dotenv
+from typing import TYPE_CHECKING
+from urllib.parse import unquote, urlparse
+
+# psycopg2 and dotenv are imported where used so CSV-only callers skip them
+if TYPE_CHECKING:
+    from psycopg2.extensions import cursor as Cursor
+
+# Rows sent per multi-row INSERT statement
+UPSERT_PAGE_SIZE = 500
+# Above this many entries, stage rows with COPY instead of multi-row INSERTs
+COPY_THRESHOLD = 500
+
+# Conflict handling shared by the INSERT and COPY upsert paths
+_ON_CONFLICT_SQL = """
+    ON CONFLICT (entry) DO UPDATE SET
+        meaning = EXCLUDED.meaning,
+        range = EXCLUDED.range,
+        interpretation = EXCLUDED.interpretation,
+        updated_at = CURRENT_TIMESTAMP
+"""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GlossaryEntry:
     """A glossary entry with its definition and interpretation."""
 
@@ -29,8 +50,13 @@ class GlossaryEntry:
     interpretation: str | None
 
 
-# Module-level cache for parsed data
-_cached_entries: list[GlossaryEntry] | None = None
+# Module-level cache for parsed data: the entries and a lowercase name ->
+# entry index, published together in one assignment so a reader never sees
+# entries whose index is still being built
+_EntriesCache = tuple[tuple[GlossaryEntry, ...], dict[str, GlossaryEntry]]
+_cached_entries: _EntriesCache | None = None
+# Serializes reload_entries(); readers never take it
+_reload_lock = threading.Lock()
 
 
 def _get_csv_path() -> Path:
@@ -43,23 +69,40 @@ def _parse_csv() -> list[GlossaryEntry]:
     """Parse the glossary CSV file and return list of entries."""
     csv_path = _get_csv_path()
 
-    if not csv_path.exists():
-        raise FileNotFoundError(f"Glossary CSV not found: {csv_path}")
+    # Read the whole file at once (BOM stripped) and use the plain row reader;
+    # DictReader would build a dict per row only to look up four keys
+    try:
+        text = csv_path.read_text(encoding="utf-8-sig")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Glossary CSV not found: {csv_path}") from None
+    reader = csv.reader(io.StringIO(text))
+    header = [name.strip() for name in next(reader, [])]
+    if not header:
+        # An empty file has no entries, as with csv.DictReader
+        return []
+    missing = [name for name in ("Entry", "Meaning") if name not in header]
+    if missing:
+        raise ValueError(f"Glossary CSV header is missing columns: {missing}")
+    entry_idx = header.index("Entry")
+    meaning_idx = header.index("Meaning")
+    range_idx = header.index("Range") if "Range" in header else None
+    interp_idx = header.index("Interpretation") if "Interpretation" in header else None
+
+    def cell(row: list[str], idx: int | None) -> str:
+        return row[idx].strip() if idx is not None and idx < len(row) else ""
 
     entries: list[GlossaryEntry] = []
-
-    # Read CSV with BOM handling
-    with open(csv_path, encoding="utf-8-sig", newline="") as f:
-        reader = csv.DictReader(f)
-
-        for row in reader:
-            entry = GlossaryEntry(
-                entry=row["Entry"].strip(),
-                meaning=row["Meaning"].strip(),
-                range=row.get("Range", "").strip() or None,
-                interpretation=row.get("Interpretation", "").strip() or None,
+    for row in reader:
+        if not row:
+            continue
+        entries.append(
+            GlossaryEntry(
+                entry=cell(row, entry_idx),
+                meaning=cell(row, meaning_idx),
+                range=cell(row, range_idx) or None,
+                interpretation=cell(row, interp_idx) or None,
             )
-            entries.append(entry)
+        )
 
     return entries
 
@@ -76,17 +119,64 @@ def get_glossary_entries() -> list[GlossaryEntry]:
         >>> entries[0].entry
         'Gini Coefficient'
     """
+    return list(_get_entries())
+
+
+def iter_glossary_entries() -> tuple[GlossaryEntry, ...]:
+    """Get all glossary entries without copying them.
+
+    Read-only counterpart of get_glossary_entries for callers that only
+    iterate: returns the cached tuple itself, shared by every caller.
+
+    Returns:
+        Tuple of GlossaryEntry objects.
+
+    Example:
+        >>> from utilities.glossary import iter_glossary_entries
+        >>> iter_glossary_entries() is iter_glossary_entries()
+        True
+    """
+    return _get_entries()
+
+
+def _load_entries() -> _EntriesCache:
+    """Parse the CSV and build the entries tuple with its name index."""
+    entries = tuple(_parse_csv())
+    by_lower: dict[str, GlossaryEntry] = {}
+    for entry in entries:
+        # Keep the first entry for a name, as a linear scan would
+        by_lower.setdefault(entry.entry.lower(), entry)
+    return entries, by_lower
+
+
+def _get_cache() -> _EntriesCache:
+    """Get the cached entries and index, loading them if necessary."""
     global _cached_entries
-    if _cached_entries is None:
-        _cached_entries = _parse_csv()
-    return _cached_entries.copy()
+    cache = _cached_entries
+    if cache is None:
+        cache = _cached_entries = _load_entries()
+    return cache
+
+
+def _get_entries() -> tuple[GlossaryEntry, ...]:
+    """Get cached entries, parsing and indexing them if necessary."""
+    return _get_cache()[0]
+
+
+# Keyed on the caller's spelling so a cache hit skips case folding
+@lru_cache(maxsize=256)
+def _entry_by_name(name: str) -> GlossaryEntry | None:
+    """Return the entry for a name in any case, or None if unknown."""
+    return _get_cache()[1].get(name.lower())
 
 
 def reload_entries() -> None:
     """Force reload of glossary entries from CSV."""
     global _cached_entries
-    _cached_entries = None
-    get_glossary_entries()
+    with _reload_lock:
+        # Publish the new data before dropping lookups made from the old
+        _cached_entries = _load_entries()
+        _entry_by_name.cache_clear()
 
 
 def get_entry(entry_name: str) -> GlossaryEntry:
@@ -107,15 +197,16 @@ def get_entry(entry_name: str) -> GlossaryEntry:
         >>> gini.interpretation
         'Lower is better'
     """
-    entries = get_glossary_entries()
-    for entry in entries:
-        if entry.entry.lower() == entry_name.lower():
-            return entry
+    entry = _entry_by_name(entry_name)
+    if entry is not None:
+        return entry
     raise ValueError(f"Entry '{entry_name}' not found in glossary.")
 
 
 def _get_database_url() -> str:
     """Get database URL from environment."""
+    from dotenv import load_dotenv
+
     load_dotenv()
     url = os.getenv("DATABASE_URL")
     if not url:
@@ -125,45 +216,73 @@ def _get_database_url() -> str:
 
 def _parse_database_url(url: str) -> dict[str, str]:
     """Parse PostgreSQL URL into connection parameters."""
-    url = url.replace("postgresql://", "").replace("postgresql+asyncpg://", "")
+    # SQLAlchemy-style driver suffixes (postgresql+asyncpg://) are not part of
+    # the scheme libpq understands, so drop them before parsing
+    parsed = urlparse(url.replace("+asyncpg", "", 1))
 
-    if "@" in url:
-        auth, rest = url.split("@", 1)
-        user, password = auth.split(":", 1) if ":" in auth else (auth, "")
-    else:
-        user, password = "", ""
-        rest = url
+    return {
+        "host": parsed.hostname or "",
+        "port": str(parsed.port or 5432),
+        "user": unquote(parsed.username or ""),
+        "password": unquote(parsed.password or ""),
+        "database": parsed.path.lstrip("/"),
+    }
 
-    if "/" in rest:
-        host_port, database = rest.split("/", 1)
-    else:
-        host_port, database = rest, ""
 
-    if ":" in host_port:
-        host, port = host_port.split(":", 1)
-    else:
-        host, port = host_port, "5432"
+def _copy_csv_field(value: str | None) -> str:
+    """Format one value for COPY ... (FORMAT csv), keeping None and "" apart."""
+    if value is None:
+        return ""
+    return '"' + value.replace('"', '""') + '"'
 
-    return {
-        "host": host,
-        "port": port,
-        "user": user,
-        "password": password,
-        "database": database,
-    }
+
+def _copy_upsert(
+    cursor: "Cursor", rows: list[tuple[str, str, str | None, str | None]]
+) -> None:
+    """Upsert rows by COPYing them into a temp table and merging from it.
+
+    COPY streams all rows in one pass, which is much faster than INSERT for
+    large ingests. The staging table is dropped when the transaction commits.
+    """
+    # In COPY's CSV format an unquoted empty field reads as NULL and a quoted
+    # one as an empty string, so quote every string and leave only None bare;
+    # csv.writer writes both as a bare empty field
+    buf = io.StringIO()
+    for row in rows:
+        buf.write(",".join(_copy_csv_field(value) for value in row))
+        buf.write("\n")
+    buf.seek(0)
+
+    cursor.execute(
+        "CREATE TEMP TABLE glossary_stage "
+        "(entry TEXT, meaning TEXT, range TEXT, interpretation TEXT) "
+        "ON COMMIT DROP"
+    )
+    cursor.copy_expert(
+        "COPY glossary_stage (entry, meaning, range, interpretation) "
+        "FROM STDIN WITH (FORMAT csv)",
+        buf,
+    )
+    cursor.execute(
+        "INSERT INTO glossary (entry, meaning, range, interpretation, updated_at) "
+        "SELECT entry, meaning, range, interpretation, CURRENT_TIMESTAMP "
+        "FROM glossary_stage" + _ON_CONFLICT_SQL
+    )
 
 
 def upsert_glossary_entries(
-    entries: list[GlossaryEntry] | None = None,
+    entries: Sequence[GlossaryEntry] | None = None,
     dry_run: bool = False,
 ) -> int:
     """Upsert glossary entries into the database.
 
     Uses INSERT ... ON CONFLICT DO UPDATE to handle repeated ingestion.
-    The 'entry' column is the unique key for conflict detection.
+    The 'entry' column is the unique key for conflict detection. Rows are
+    sent as multi-row VALUES lists of up to UPSERT_PAGE_SIZE entries, or
+    bulk-loaded with COPY when there are more than COPY_THRESHOLD entries.
 
     Args:
-        entries: List of entries to upsert (defaults to all from CSV).
+        entries: Entries to upsert (defaults to all from CSV).
         dry_run: If True, only print what would be done without DB writes.
 
     Returns:
@@ -176,7 +295,7 @@ def upsert_glossary_entries(
         Upserted 4 entries
     """
     if entries is None:
-        entries = get_glossary_entries()
+        entries = _get_entries()
 
     if not entries:
         print("No entries to upsert.")
@@ -188,21 +307,27 @@ def upsert_glossary_entries(
             print(f"  - {entry.entry}: {entry.interpretation}")
         return len(entries)
 
+    import psycopg2
+    from psycopg2.extras import execute_values
+
     url = _get_database_url()
     params = _parse_database_url(url)
 
-    upsert_sql = """
-        INSERT INTO glossary (entry, meaning, range, interpretation, updated_at)
-        VALUES (%s, %s, %s, %s, CURRENT_TIMESTAMP)
-        ON CONFLICT (entry) DO UPDATE SET
-            meaning = EXCLUDED.meaning,
-            range = EXCLUDED.range,
-            interpretation = EXCLUDED.interpretation,
-            updated_at = CURRENT_TIMESTAMP
-    """
+    upsert_sql = (
+        "INSERT INTO glossary (entry, meaning, range, interpretation, updated_at) "
+        "VALUES %s" + _ON_CONFLICT_SQL
+    )
+    # One statement cannot update the same row twice (ON CONFLICT raises
+    # "cannot affect row a second time"), so keep only the last entry for
+    # each name, matching what repeated single-row upserts would store
+    rows = list(
+        {
+            entry.entry: (entry.entry, entry.meaning, entry.range, entry.interpretation)
+            for entry in entries
+        }.values()
+    )
 
     conn = None
-    count = 0
     try:
         conn = psycopg2.connect(
             host=params["host"],
@@ -211,14 +336,22 @@ def upsert_glossary_entries(
             password=params["password"],
             database=params["database"],
         )
+        # All pages (or the COPY staging table, dropped ON COMMIT) must share
+        # one transaction so the ingest commits or rolls back as a unit
+        conn.autocommit = False
 
         with conn.cursor() as cursor:
-            for entry in entries:
-                cursor.execute(
+            if len(rows) > COPY_THRESHOLD:
+                _copy_upsert(cursor, rows)
+            else:
+                execute_values(
+                    cursor,
                     upsert_sql,
-                    (entry.entry, entry.meaning, entry.range, entry.interpretation),
+                    rows,
+                    template="(%s, %s, %s, %s, CURRENT_TIMESTAMP)",
+                    page_size=UPSERT_PAGE_SIZE,
                 )
-                count += 1
+        count = len(entries)
 
         conn.commit()
         print(f"Upserted {count} glossary entries")
@@ -292,7 +425,7 @@ Examples:
 
     # Default: show all entries
     print("=== Glossary Entries ===\n")
-    entries = get_glossary_entries()
+    entries = iter_glossary_entries()
     for entry in entries:
         print(f"* {entry.entry}")
         print(f"  Range: {entry.range}")
@@ -0,0 +1,22 @@
+"""Shared pytest fixtures for utilities tests."""
+
+from collections.abc import Iterator
+
+import pytest
+
+from utilities._warmup import warm_up
+from utilities.countries_info import CACHE_DISABLE_ENV
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _loaded_data() -> Iterator[None]:
+    """Load the countries and glossary caches once for the whole session.
+
+    The on-disk countries pickle cache is disabled so tests never read or
+    write a sidecar next to the real CSV. Tests that call reload_data() or
+    reload_entries() re-parse on their own; everything else reuses this load.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv(CACHE_DISABLE_ENV, "1")
+        warm_up()
+        yield
@@ -3,14 +3,25 @@
 import pytest
 
 from utilities.color_palette import (
+    _DEFAULT_SCALE_LUT,
+    _NORM_LUT,
     BAD_COLOR,
+    BAD_RGB,
     GOOD_COLOR,
+    GOOD_RGB,
     NEUTRAL_COLOR,
+    NEUTRAL_RGB,
+    _color_in_range,
+    _compute_color,
+    _compute_normalized_color,
     _hex_to_rgb,
     _interpolate_rgb,
     _rgb_to_hex,
+    clear_cache,
     get_color_for_normalized_value,
     get_color_for_value,
+    get_colors_for_normalized_values,
+    get_colors_for_values,
 )
 
 
@@ -33,57 +44,92 @@ class TestColorConstants:
 class TestHelperFunctions:
     """Tests for helper functions."""
 
-    def test_rgb_to_hex_red(self) -> None:
-        """Test RGB to hex conversion for red."""
-        assert _rgb_to_hex((255, 0, 0)) == "#FF0000"
-
-    def test_rgb_to_hex_green(self) -> None:
-        """Test RGB to hex conversion for green."""
-        assert _rgb_to_hex((0, 255, 0)) == "#00FF00"
-
-    def test_rgb_to_hex_blue(self) -> None:
-        """Test RGB to hex conversion for blue."""
-        assert _rgb_to_hex((0, 0, 255)) == "#0000FF"
-
-    def test_rgb_to_hex_black(self) -> None:
-        """Test RGB to hex conversion for black."""
-        assert _rgb_to_hex((0, 0, 0)) == "#000000"
-
-    def test_rgb_to_hex_white(self) -> None:
-        """Test RGB to hex conversion for white."""
-        assert _rgb_to_hex((255, 255, 255)) == "#FFFFFF"
-
-    def test_hex_to_rgb_red(self) -> None:
-        """Test hex to RGB conversion for red."""
-        assert _hex_to_rgb("#FF0000") == (255, 0, 0)
-
-    def test_hex_to_rgb_green(self) -> None:
-        """Test hex to RGB conversion for green."""
-        assert _hex_to_rgb("#00FF00") == (0, 255, 0)
-
-    def test_hex_to_rgb_without_hash(self) -> None:
-        """Test hex to RGB conversion without hash prefix."""
-        assert _hex_to_rgb("00FF00") == (0, 255, 0)
-
-    def test_interpolate_rgb_start(self) -> None:
-        """Test interpolation at start (t=0)."""
-        result = _interpolate_rgb((255, 0, 0), (0, 255, 0), 0.0)
-        assert result == (255, 0, 0)
-
-    def test_interpolate_rgb_end(self) -> None:
-        """Test interpolation at end (t=1)."""
-        result = _interpolate_rgb((255, 0, 0), (0, 255, 0), 1.0)
-        assert result == (0, 255, 0)
-
-    def test_interpolate_rgb_middle(self) -> None:
-        """Test interpolation at middle (t=0.5)."""
-        result = _interpolate_rgb((255, 0, 0), (0, 255, 0), 0.5)
-        assert result == (127, 127, 0)
-
-    def test_interpolate_rgb_quarter(self) -> None:
-        """Test interpolation at quarter (t=0.25)."""
-        result = _interpolate_rgb((255, 0, 0), (0, 255, 0), 0.25)
-        assert result == (191, 63, 0)
+    @pytest.mark.parametrize(
+        ("rgb", "expected"),
+        [
+            ((255, 0, 0), "#FF0000"),
+            ((0, 255, 0), "#00FF00"),
+            ((0, 0, 255), "#0000FF"),
+            ((0, 0, 0), "#000000"),
+            ((255, 255, 255), "#FFFFFF"),
+        ],
+        ids=["red", "green", "blue", "black", "white"],
+    )
+    def test_rgb_to_hex(self, rgb: tuple[int, int, int], expected: str) -> None:
+        """Test RGB to hex conversion."""
+        assert _rgb_to_hex(rgb) == expected
+
+    @pytest.mark.parametrize(
+        ("hex_color", "expected"),
+        [
+            ("#FF0000", (255, 0, 0)),
+            ("#00FF00", (0, 255, 0)),
+            ("00FF00", (0, 255, 0)),
+            ("#ffffFA", (255, 255, 250)),
+        ],
+        ids=["red", "green", "without-hash", "lowercase"],
+    )
+    def test_hex_to_rgb(self, hex_color: str, expected: tuple[int, int, int]) -> None:
+        """Test hex to RGB conversion, with or without hash and in any case."""
+        assert _hex_to_rgb(hex_color) == expected
+
+    @pytest.mark.parametrize(
+        "hex_color",
+        ["0xFF0000", "FF_00_00", " FF0000", "FF0000 ", "#FF000080", "#FFF", "#GG0000"],
+        ids=[
+            "0x-prefix",
+            "underscores",
+            "leading-space",
+            "trailing-space",
+            "rgba",
+            "short",
+            "non-hex",
+        ],
+    )
+    def test_hex_to_rgb_rejects_invalid(self, hex_color: str) -> None:
+        """Test that anything but six hex digits raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid hex color"):
+            _hex_to_rgb(hex_color)
+
+    @pytest.mark.parametrize(
+        ("t", "expected"),
+        [
+            (0.0, (255, 0, 0)),
+            (1.0, (0, 255, 0)),
+            (0.5, (127, 127, 0)),
+            (0.25, (191, 63, 0)),
+        ],
+        ids=["start", "end", "middle", "quarter"],
+    )
+    def test_interpolate_rgb(self, t: float, expected: tuple[int, int, int]) -> None:
+        """Test red-to-green interpolation at several points."""
+        assert _interpolate_rgb((255, 0, 0), (0, 255, 0), t) == expected
+
+    @pytest.mark.parametrize(
+        ("higher_is_better", "offset", "start", "end"),
+        [
+            (True, 0.0, BAD_RGB, NEUTRAL_RGB),
+            (True, 50.0, NEUTRAL_RGB, GOOD_RGB),
+            (False, 0.0, GOOD_RGB, NEUTRAL_RGB),
+            (False, 50.0, NEUTRAL_RGB, BAD_RGB),
+        ],
+        ids=["bad-zone", "good-zone", "lower-good-zone", "lower-bad-zone"],
+    )
+    def test_color_in_range_matches_helpers(
+        self,
+        higher_is_better: bool,
+        offset: float,
+        start: tuple[int, int, int],
+        end: tuple[int, int, int],
+    ) -> None:
+        """Test the inlined interpolation equals _interpolate_rgb + _rgb_to_hex."""
+        for step in range(1, 501):
+            value = offset + step / 10
+            t = (value - offset) / 50.0
+            expected = _rgb_to_hex(_interpolate_rgb(start, end, t))
+            assert _color_in_range(value, 0.0, 100.0, higher_is_better, 50.0) == (
+                expected
+            )
 
 
 class TestGetColorForValue:
@@ -187,6 +233,31 @@ class TestGetColorForValue:
         rgb = _hex_to_rgb(result)
         assert rgb[1] == 255  # In green zone
 
+    def test_repeated_call_hits_cache(self) -> None:
+        """Test repeated arguments reuse the cached color."""
+        first = get_color_for_value(63.5, 0, 100, higher_is_better=False)
+        hits = _compute_color.cache_info().hits
+        second = get_color_for_value(
+            63.5, min_val=0, max_val=100, higher_is_better=False
+        )
+        assert second == first
+        assert _compute_color.cache_info().hits == hits + 1
+
+    def test_invalid_range_raises_on_every_call(self) -> None:
+        """Test errors are raised again rather than cached."""
+        for _ in range(2):
+            with pytest.raises(ValueError, match="min_val"):
+                get_color_for_value(50, 100, 0)
+
+    def test_clear_cache_empties_both_caches(self) -> None:
+        """Test clear_cache resets the value and normalized-value caches."""
+        get_color_for_value(12.5)
+        get_color_for_normalized_value(0.25)
+        clear_cache()
+        assert _compute_color.cache_info().currsize == 0
+        assert _compute_normalized_color.cache_info().currsize == 0
+        assert get_color_for_normalized_value(0.25) == "#FF7F7D"
+
 
 class TestGetColorForNormalizedValue:
     """Tests for get_color_for_normalized_value function."""
@@ -226,6 +297,117 @@ class TestGetColorForNormalizedValue:
         assert rgb[1] == 255  # In green zone
 
 
+class TestNormalizedLookupTable:
+    """Tests for the precomputed normalized-value color table."""
+
+    def test_entries_match_computed_colors(self) -> None:
+        """Test every table entry equals the uncached computation."""
+        assert len(_NORM_LUT) == 1001
+        for value, color in _NORM_LUT.items():
+            assert color == _compute_normalized_color.__wrapped__(value)
+
+    def test_off_grid_values_are_computed(self) -> None:
+        """Test values between table keys keep their exact colors."""
+        for value in (0.2504, 0.49999, 0.7501):
+            assert value not in _NORM_LUT
+            expected = _compute_normalized_color.__wrapped__(value)
+            assert get_color_for_normalized_value(value) == expected
+
+
+class TestDefaultScaleLookupTable:
+    """Tests for the precomputed default-scale color table."""
+
+    def test_entries_match_computed_colors(self) -> None:
+        """Test every table entry equals the uncached computation."""
+        assert len(_DEFAULT_SCALE_LUT) == 1001
+        for value, color in _DEFAULT_SCALE_LUT.items():
+            assert color == _compute_color.__wrapped__(value, 0.0, 100.0, True, None)
+
+    def test_lookup_skips_cache(self) -> None:
+        """Test on-grid default-scale values are served from the table."""
+        clear_cache()
+        assert get_color_for_value(75) == _DEFAULT_SCALE_LUT[75.0]
+        assert get_color_for_value(12.3) == _DEFAULT_SCALE_LUT[12.3]
+        assert _compute_color.cache_info().currsize == 0
+
+    def test_off_grid_and_custom_scales_are_computed(self) -> None:
+        """Test values off the grid or on other scales keep their colors."""
+        assert 12.34 not in _DEFAULT_SCALE_LUT
+        expected = _compute_color.__wrapped__(12.34, 0.0, 100.0, True, None)
+        assert get_color_for_value(12.34) == expected
+        assert get_color_for_value(75, median_val=70) == _compute_color.__wrapped__(
+            75, 0.0, 100.0, True, 70
+        )
+        assert get_color_for_value(75, higher_is_better=False) == (
+            _compute_color.__wrapped__(75, 0.0, 100.0, False, None)
+        )
+
+
+class TestGetColorsForNormalizedValues:
+    """Tests for get_colors_for_normalized_values function."""
+
+    def test_matches_scalar_function(self) -> None:
+        """Test batch results match per-value conversion."""
+        values = [-0.5, 0.0, 0.1234, 0.25, 0.5, 0.75, 0.999, 1.0, 1.5]
+        expected = [get_color_for_normalized_value(v) for v in values]
+        assert get_colors_for_normalized_values(values) == expected
+
+    def test_repeated_values(self) -> None:
+        """Test repeated values keep their positions in the output."""
+        result = get_colors_for_normalized_values([0.0, 1.0, 0.0])
+        assert result == ["#FF0000", "#00FF00", "#FF0000"]
+
+    def test_accepts_generator(self) -> None:
+        """Test any iterable of values is accepted."""
+        result = get_colors_for_normalized_values(v / 2 for v in range(3))
+        assert result == ["#FF0000", "#FFFFFA", "#00FF00"]
+
+    def test_empty_input(self) -> None:
+        """Test empty input returns an empty list."""
+        assert get_colors_for_normalized_values([]) == []
+
+
+class TestGetColorsForValues:
+    """Tests for get_colors_for_values function."""
+
+    @pytest.mark.parametrize("higher_is_better", [True, False])
+    @pytest.mark.parametrize("median_val", [None, 0.0, 20.0, 70.0, 100.0])
+    def test_matches_scalar_function(
+        self, higher_is_better: bool, median_val: float | None
+    ) -> None:
+        """Test batch results match per-value conversion."""
+        values = [-10.0, 0.0, 10.0, 19.9, 20.0, 33.33, 50.0, 70.0, 94.0, 100.0, 110]
+        expected = [
+            get_color_for_value(v, 0, 100, higher_is_better, median_val) for v in values
+        ]
+        result = get_colors_for_values(values, 0, 100, higher_is_better, median_val)
+        assert result == expected
+
+    @pytest.mark.parametrize("higher_is_better", [True, False])
+    def test_dense_grid_matches_scalar_function(self, higher_is_better: bool) -> None:
+        """Test the batch loop agrees with per-value conversion on a fine grid."""
+        values = [-3.3 + step / 97 for step in range(1100)]
+        expected = [
+            get_color_for_value(v, -3.3, 7.7, higher_is_better, 1.1) for v in values
+        ]
+        result = get_colors_for_values(values, -3.3, 7.7, higher_is_better, 1.1)
+        assert result == expected
+
+    def test_repeated_values(self) -> None:
+        """Test repeated values keep their positions in the output."""
+        result = get_colors_for_values([0, 100, 0])
+        assert result == ["#FF0000", "#00FF00", "#FF0000"]
+
+    def test_empty_input(self) -> None:
+        """Test empty input returns an empty list."""
+        assert get_colors_for_values([]) == []
+
+    def test_invalid_range_raises_even_when_empty(self) -> None:
+        """Test that the range is validated up front."""
+        with pytest.raises(ValueError, match="min_val"):
+            get_colors_for_values([], 100, 0)
+
+
 class TestEdgeCases:
     """Tests for edge cases."""
 
@@ -240,6 +422,24 @@ class TestEdgeCases:
         # 0 is middle of -100 to 100, so neutral
         assert result == "#FFFFFA"
 
+    def test_numpy_scalar_inputs(self) -> None:
+        """Test numpy scalars and bools give the same colors as Python numbers."""
+        np = pytest.importorskip("numpy")
+        assert get_color_for_value(np.float64(50.05)) == get_color_for_value(50.05)
+        assert get_color_for_value(np.float32(20.2)) == get_color_for_value(
+            float(np.float32(20.2))
+        )
+        assert get_color_for_value(
+            np.int64(30), higher_is_better=False
+        ) == get_color_for_value(30, higher_is_better=False)
+        assert get_color_for_value(70, higher_is_better=np.False_) == (
+            get_color_for_value(70, higher_is_better=False)
+        )
+        values = np.array([10.0, 50.0, 90.0])
+        assert get_colors_for_values(
+            values, higher_is_better=np.False_
+        ) == get_colors_for_values([10.0, 50.0, 90.0], higher_is_better=False)
+
     def test_float_precision(self) -> None:
         """Test with floating point values."""
         result = get_color_for_value(33.33, 0, 100, higher_is_better=True)
@@ -266,37 +466,37 @@ class TestEdgeCases:
 class TestAsymmetricGradients:
     """Tests for asymmetric gradient support (median_val parameter)."""
 
-    def test_spec_example1_median_value(self) -> None:
-        """Test spec example 1: value=70 at median returns neutral."""
-        result = get_color_for_value(70, 0, 100, higher_is_better=True, median_val=70)
-        assert result == "#FFFFFA"
-
-    def test_spec_example1_value_94(self) -> None:
-        """Test spec example 1: value=94 in good zone."""
-        result = get_color_for_value(94, 0, 100, higher_is_better=True, median_val=70)
-        assert result == "#33FF32"
-
-    def test_spec_example1_value_28(self) -> None:
-        """Test spec example 1: value=28 in bad zone."""
-        result = get_color_for_value(28, 0, 100, higher_is_better=True, median_val=70)
-        assert result == "#FF6664"
-
-    def test_spec_example2_median_value(self) -> None:
-        """Test spec example 2: value=20 at median returns neutral."""
-        result = get_color_for_value(20, 0, 100, higher_is_better=False, median_val=20)
-        assert result == "#FFFFFA"
-
-    def test_spec_example2_value_10(self) -> None:
-        """Test spec example 2: value=10 in good zone (lower is better)."""
-        result = get_color_for_value(10, 0, 100, higher_is_better=False, median_val=20)
-        # t = 0.5, lerp(GOOD, NEUTRAL, 0.5) -> int(127.5) = 127 = 0x7F
-        assert result == "#7FFF7D"
-
-    def test_spec_example2_value_60(self) -> None:
-        """Test spec example 2: value=60 in bad zone (lower is better)."""
-        result = get_color_for_value(60, 0, 100, higher_is_better=False, median_val=20)
-        # t = 0.5, lerp(NEUTRAL, BAD, 0.5) -> int(127.5) = 127 = 0x7F
-        assert result == "#FF7F7D"
+    @pytest.mark.parametrize(
+        ("value", "higher_is_better", "median_val", "expected"),
+        [
+            # Spec example 1: median 70, higher is better
+            (70, True, 70, "#FFFFFA"),
+            (94, True, 70, "#33FF32"),
+            (28, True, 70, "#FF6664"),
+            # Spec example 2: median 20, lower is better
+            (20, False, 20, "#FFFFFA"),
+            # t = 0.5, lerp(GOOD, NEUTRAL, 0.5) -> int(127.5) = 127 = 0x7F
+            (10, False, 20, "#7FFF7D"),
+            # t = 0.5, lerp(NEUTRAL, BAD, 0.5) -> int(127.5) = 127 = 0x7F
+            (60, False, 20, "#FF7F7D"),
+        ],
+        ids=[
+            "ex1-median",
+            "ex1-good-zone",
+            "ex1-bad-zone",
+            "ex2-median",
+            "ex2-good-zone",
+            "ex2-bad-zone",
+        ],
+    )
+    def test_spec_examples(
+        self, value: float, higher_is_better: bool, median_val: float, expected: str
+    ) -> None:
+        """Test the spec's asymmetric gradient examples."""
+        result = get_color_for_value(
+            value, 0, 100, higher_is_better=higher_is_better, median_val=median_val
+        )
+        assert result == expected
 
     def test_default_median_is_midpoint(self) -> None:
         """Test that None median defaults to midpoint (backward compatibility)."""
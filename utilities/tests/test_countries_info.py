@@ -1,18 +1,35 @@
 """Tests for countries_info module."""
 
+import os
+import pickle
+import threading
+from collections.abc import Callable, Iterator
+from dataclasses import FrozenInstanceError
+from pathlib import Path
+
 import pytest
 
+from utilities import countries_info
 from utilities.countries_info import (
+    CACHE_DISABLE_ENV,
     CountryInfo,
+    _read_rows,
     get_all_countries,
+    get_continent_counts,
     get_continents,
     get_countries_by_continent,
+    get_countries_by_continent_and_llm,
     get_countries_by_llm,
     get_country_info,
+    get_llm_counts,
     get_llms,
     reload_data,
 )
 
+# LLM names for parametrizing at collection time. Parsed directly so that
+# collection neither fills the module cache nor writes a pickle sidecar.
+COLLECTED_LLMS = countries_info._parse_csv().llms
+
 
 class TestGetContinents:
     """Tests for get_continents function."""
@@ -121,6 +138,12 @@ class TestGetCountriesByContinent:
         result2 = get_countries_by_continent("Africa")
         assert "FakeCountry" not in result2
 
+    def test_no_duplicates(self) -> None:
+        """Test that each continent lists a country only once."""
+        for continent in get_continents():
+            result = get_countries_by_continent(continent)
+            assert len(result) == len(set(result))
+
 
 class TestGetCountriesByLlm:
     """Tests for get_countries_by_llm function."""
@@ -143,11 +166,59 @@ class TestGetCountriesByLlm:
         with pytest.raises(ValueError, match="not found"):
             get_countries_by_llm("InvalidLLM")
 
-    def test_all_llms_have_countries(self) -> None:
-        """Test that all LLMs have at least some countries."""
-        for llm in get_llms():
-            result = get_countries_by_llm(llm)
-            assert len(result) > 0, f"{llm} has no countries"
+    def test_collected_llms_match_get_llms(self) -> None:
+        """Test that the parametrized LLM list is the full, current one."""
+        assert list(COLLECTED_LLMS) == get_llms()
+
+    @pytest.mark.parametrize("llm", COLLECTED_LLMS)
+    def test_all_llms_have_countries(self, llm: str) -> None:
+        """Test that each LLM has at least some countries."""
+        assert len(get_countries_by_llm(llm)) > 0
+
+
+class TestGetCountriesByContinentAndLlm:
+    """Tests for get_countries_by_continent_and_llm function."""
+
+    def test_matches_set_intersection(self) -> None:
+        """Test that results equal the intersection of both filters."""
+        for continent in get_continents():
+            for llm in get_llms():
+                expected = sorted(
+                    set(get_countries_by_continent(continent))
+                    & set(get_countries_by_llm(llm))
+                )
+                assert get_countries_by_continent_and_llm(continent, llm) == expected
+
+    def test_case_insensitive(self) -> None:
+        """Test that lookup is case-insensitive."""
+        result = get_countries_by_continent_and_llm("AFRICA", "openai")
+        assert result == get_countries_by_continent_and_llm("Africa", "OpenAI")
+
+    @pytest.mark.parametrize(
+        ("continent", "llm"), [("Atlantis", "OpenAI"), ("Africa", "InvalidLLM")]
+    )
+    def test_invalid_name_raises(self, continent: str, llm: str) -> None:
+        """Test that an unknown continent or LLM raises ValueError."""
+        with pytest.raises(ValueError, match="not found"):
+            get_countries_by_continent_and_llm(continent, llm)
+
+
+class TestCounts:
+    """Tests for get_continent_counts and get_llm_counts functions."""
+
+    def test_continent_counts_match_lists(self) -> None:
+        """Test that continent counts equal the per-continent list lengths."""
+        counts = get_continent_counts()
+        assert list(counts) == get_continents()
+        for continent, count in counts.items():
+            assert count == len(get_countries_by_continent(continent))
+
+    def test_llm_counts_match_lists(self) -> None:
+        """Test that LLM counts equal the per-LLM list lengths."""
+        counts = get_llm_counts()
+        assert list(counts) == get_llms()
+        for llm, count in counts.items():
+            assert count == len(get_countries_by_llm(llm))
 
 
 class TestGetCountryInfo:
@@ -178,6 +249,22 @@ class TestGetCountryInfo:
         result = get_country_info("Germany")
         assert result.continent == "Europe"
 
+    def test_info_is_frozen(self) -> None:
+        """Test that shared cached records cannot be modified."""
+        info = get_country_info("Nigeria")
+        with pytest.raises(FrozenInstanceError):
+            info.llm = "Other"  # type: ignore[misc]
+
+    def test_duplicate_country_keeps_first(self, tmp_path: Path) -> None:
+        """Test that a repeated country keeps its first continent and LLM."""
+        path = tmp_path / "countries.csv"
+        path.write_text(",,AI21,Groq\nAfrica,,Chad,\nAsia,,,chad\n", encoding="utf-8")
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(countries_info, "_get_csv_path", lambda: path)
+            data = countries_info._parse_csv()
+        assert data.country_info_map["chad"] == CountryInfo("Chad", "Africa", "AI21")
+        assert data.countries == ("Chad",)
+
     def test_china_info(self) -> None:
         """Test getting info for China (Asia)."""
         result = get_country_info("China")
@@ -185,6 +272,7 @@ class TestGetCountryInfo:
         assert result.llm == "AI21"
 
 
+@pytest.mark.xdist_group(name="serial")
 class TestReloadData:
     """Tests for reload_data function."""
 
@@ -205,6 +293,79 @@ class TestReloadData:
         # Should be same content
         assert initial == after
 
+    def test_reload_clears_lookup_caches(self) -> None:
+        """Test that reload discards cached case-insensitive lookups."""
+        before = get_country_info("Nigeria")
+        reload_data()
+        after = get_country_info("Nigeria")
+        assert after is not before
+        assert after == before
+
+    def test_concurrent_reloads_leave_consistent_data(self) -> None:
+        """Test that reloads from several threads are serialized."""
+        expected = get_continents()
+        threads = [threading.Thread(target=reload_data) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert get_continents() == expected
+        assert get_country_info("nigeria").country == "Nigeria"
+
+
+@pytest.mark.xdist_group(name="serial")
+class TestPrebuiltIndexes:
+    """Tests that lookups are served from indexes built at load time."""
+
+    def test_lookups_never_reparse(self) -> None:
+        """Test that every lookup, in any case, works without re-reading the CSV."""
+        reload_data()
+        countries = get_all_countries()
+
+        def fail() -> None:
+            raise AssertionError("CSV should not be re-parsed")
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(countries_info, "_parse_csv", fail)
+            for continent in get_continents():
+                assert get_countries_by_continent(continent.upper()) == (
+                    get_countries_by_continent(continent.lower())
+                )
+            for llm in get_llms():
+                assert get_countries_by_llm(llm.swapcase()) == get_countries_by_llm(llm)
+            for country in countries:
+                assert get_country_info(country.upper()).country == country
+
+
+class TestImmutableStorage:
+    """Tests that cached data is stored as tuples and returned as fresh lists."""
+
+    def test_cached_collections_are_tuples(self) -> None:
+        """Test that the parsed data cannot be mutated in place."""
+        data = countries_info._get_data()
+        assert isinstance(data.continents, tuple)
+        assert isinstance(data.llms, tuple)
+        assert isinstance(data.countries, tuple)
+        assert all(isinstance(v, tuple) for v in data.continent_countries.values())
+        assert all(isinstance(v, tuple) for v in data.llm_countries.values())
+
+    @pytest.mark.parametrize(
+        "getter",
+        [
+            get_continents,
+            get_llms,
+            get_all_countries,
+            lambda: get_countries_by_llm("OpenAI"),
+            lambda: get_countries_by_continent_and_llm("Africa", "OpenAI"),
+        ],
+    )
+    def test_getters_return_fresh_lists(self, getter: Callable[[], list[str]]) -> None:
+        """Test that each call returns a new list the caller may modify."""
+        first = getter()
+        assert isinstance(first, list)
+        first.clear()
+        assert getter()
+
 
 class TestEdgeCases:
     """Tests for edge cases."""
@@ -223,3 +384,109 @@ class TestEdgeCases:
         """Test that empty string raises ValueError."""
         with pytest.raises(ValueError):
             get_country_info("")
+
+
+class TestReadRows:
+    """Tests for the _read_rows CSV reader."""
+
+    def test_splits_plain_rows(self, tmp_path: Path) -> None:
+        """Test that unquoted rows are split on commas and the BOM dropped."""
+        path = tmp_path / "countries.csv"
+        path.write_text("\ufeff,,AI21\nAfrica,,Nigeria\n", encoding="utf-8")
+        assert _read_rows(path) == [["", "", "AI21"], ["Africa", "", "Nigeria"]]
+
+    def test_missing_file_raises(self, tmp_path: Path) -> None:
+        """Test that a missing CSV raises a descriptive FileNotFoundError."""
+        with pytest.raises(FileNotFoundError, match="Countries CSV not found"):
+            _read_rows(tmp_path / "missing.csv")
+
+    def test_quoted_cells_use_csv_reader(self, tmp_path: Path) -> None:
+        """Test that quoted cells containing commas are kept intact."""
+        path = tmp_path / "countries.csv"
+        path.write_text(',,AI21\nAfrica,,"Congo, Republic of"\n', encoding="utf-8")
+        assert _read_rows(path)[1] == ["Africa", "", "Congo, Republic of"]
+
+
+@pytest.mark.xdist_group(name="serial")
+class TestPickleCache:
+    """Tests for the on-disk pickle cache of parsed data."""
+
+    @pytest.fixture
+    def csv_path(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> Iterator[Path]:
+        """Point the module at a temporary CSV with the pickle cache enabled."""
+        path = tmp_path / "countries.csv"
+        path.write_text(",,AI21\nAfrica,,Nigeria\n", encoding="utf-8")
+        real_csv_path = countries_info._get_csv_path
+        monkeypatch.delenv(CACHE_DISABLE_ENV)
+        monkeypatch.setattr(countries_info, "_get_csv_path", lambda: path)
+        reload_data()
+        yield path
+        # Restore the real CSV (with caching off) before dropping the temp data
+        monkeypatch.setenv(CACHE_DISABLE_ENV, "1")
+        monkeypatch.setattr(countries_info, "_get_csv_path", real_csv_path)
+        reload_data()
+
+    def test_writes_sidecar(self, csv_path: Path) -> None:
+        """Test that parsing writes a pickle next to the CSV."""
+        assert countries_info._get_cache_path(csv_path).exists()
+
+    def test_loads_from_sidecar(self, csv_path: Path) -> None:
+        """Test that a fresh sidecar is used without re-parsing the CSV."""
+        countries_info._cached_data = None
+
+        def fail() -> None:
+            raise AssertionError("CSV should not be re-parsed")
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(countries_info, "_parse_csv", fail)
+            assert get_all_countries() == ["Nigeria"]
+
+    def test_stale_sidecar_is_reparsed(self, csv_path: Path) -> None:
+        """Test that editing the CSV invalidates the sidecar."""
+        csv_path.write_text(",,AI21\nAfrica,,Ghana\n", encoding="utf-8")
+        stat = csv_path.stat()
+        os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        countries_info._cached_data = None
+        assert get_all_countries() == ["Ghana"]
+
+    def test_sidecar_with_other_layout_is_reparsed(self, csv_path: Path) -> None:
+        """Test that a sidecar pickled for another layout key is not used."""
+        mtime = csv_path.stat().st_mtime_ns
+        stale = countries_info._parse_csv()
+        stale.countries = ("Atlantis",)
+        key = (countries_info._CACHE_FORMAT - 1,) + countries_info._cache_key()[1:]
+        with open(countries_info._get_cache_path(csv_path), "wb") as f:
+            pickle.dump((key, mtime, stale), f)
+        countries_info._cached_data = None
+        assert get_all_countries() == ["Nigeria"]
+
+    def test_unversioned_sidecar_is_reparsed(self, csv_path: Path) -> None:
+        """Test that a pre-versioning (mtime, data) sidecar is not used."""
+        mtime = csv_path.stat().st_mtime_ns
+        stale = countries_info._parse_csv()
+        stale.countries = ("Atlantis",)
+        with open(countries_info._get_cache_path(csv_path), "wb") as f:
+            pickle.dump((mtime, stale), f)
+        countries_info._cached_data = None
+        assert get_all_countries() == ["Nigeria"]
+
+    def test_cache_key_tracks_frozen_country_info(self) -> None:
+        """Test that the layout key records CountryInfo's frozen setting."""
+        key = countries_info._cache_key()
+        assert key[0] == countries_info._CACHE_FORMAT
+        assert ("CountryInfo", ("country", "continent", "llm"), True, True) in key
+
+    def test_corrupt_sidecar_is_ignored(self, csv_path: Path) -> None:
+        """Test that an unreadable sidecar falls back to parsing."""
+        countries_info._get_cache_path(csv_path).write_bytes(b"not a pickle")
+        countries_info._cached_data = None
+        assert get_all_countries() == ["Nigeria"]
+
+    def test_reload_removes_sidecar(self, csv_path: Path) -> None:
+        """Test that reload_data discards the old sidecar before re-parsing."""
+        sidecar = countries_info._get_cache_path(csv_path)
+        sidecar.write_bytes(b"stale")
+        reload_data()
+        assert sidecar.read_bytes() != b"stale"
@@ -0,0 +1,33 @@
+"""Tests for _warmup module."""
+
+import pytest
+
+from utilities import countries_info, glossary
+from utilities._warmup import warm_up
+
+
+class TestWarmUp:
+    """Tests for warm_up function."""
+
+    def test_populates_both_caches(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that both CSV caches are loaded after warm-up."""
+        monkeypatch.setenv(countries_info.CACHE_DISABLE_ENV, "1")
+        monkeypatch.setattr(countries_info, "_cached_data", None)
+        monkeypatch.setattr(glossary, "_cached_entries", None)
+
+        warm_up()
+
+        assert countries_info._cached_data is not None
+        assert glossary._cached_entries is not None
+
+    def test_propagates_parse_errors(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a failure in a worker thread is re-raised."""
+        monkeypatch.setattr(glossary, "_cached_entries", None)
+
+        def missing() -> None:
+            raise FileNotFoundError("Glossary CSV not found")
+
+        monkeypatch.setattr(glossary, "_parse_csv", missing)
+
+        with pytest.raises(FileNotFoundError):
+            warm_up()